@@ -0,0 +1,76 @@
+"""App configuration for the example API app."""
+
+import logging
+import os
+
+from django.apps import AppConfig
+from django.conf import settings
+from django.template.loader import render_to_string
+
+logger = logging.getLogger(__name__)
+
+
+class ApiConfig(AppConfig):
+    """Example API app.
+    
+    Derives the hot wallet address from X402_SIGNER_KEY once at startup so
+    views don't decode the private key on every request, and pre-renders
+    the static demo page.
+    """
+    
+    name = 'api'
+    
+    # Hot wallet (server signer) address, or None if not configured
+    hot_wallet = None
+    
+    # Rendered demo page; it takes no context, so it is rendered only once
+    index_html = b''
+    
+    def ready(self):
+        self._log_config()
+        self.index_html = render_to_string('index.html').encode('utf-8')
+        
+        signer_key = os.environ.get('X402_SIGNER_KEY', '')
+        if not signer_key:
+            return
+        
+        try:
+            import base58
+            from solders.keypair import Keypair
+        except ImportError:
+            return
+        
+        try:
+            keypair = Keypair.from_bytes(base58.b58decode(signer_key))
+        except ValueError as e:
+            logger.warning(f"X402_SIGNER_KEY is not a valid base58 keypair: {e}")
+            return
+        
+        self.hot_wallet = str(keypair.pubkey())
+    
+    def _log_config(self):
+        """Log the x402 configuration, warning if it is incomplete.
+        
+        The misconfiguration warning is always logged. The config line is
+        logged once: X402_BANNER_SHOWN is inherited by child processes (e.g.
+        the runserver autoreloader's server process), so they skip it. Set
+        DJANGO_SUPPRESS_BOOT_LOG=1 to silence the config line entirely.
+        """
+        config = settings.X402_CONFIG
+        pay_to = config.get('pay_to_address', '')
+        if not pay_to or len(pay_to) < 32 or pay_to.startswith('REPLACE'):
+            logger.warning(
+                "X402_PAY_TO_ADDRESS is not properly configured; "
+                "set it to a valid Solana address (base58, 32-44 chars)"
+            )
+        
+        if os.environ.get('X402_BANNER_SHOWN'):
+            return
+        os.environ['X402_BANNER_SHOWN'] = '1'
+        
+        if os.environ.get('DJANGO_SUPPRESS_BOOT_LOG') == '1':
+            return
+        logger.info(
+            "x402 config: network=%s pay_to=%s price=%s",
+            config.get('network'), pay_to, config.get('price'),
+        )
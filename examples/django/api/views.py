@@ -1,26 +1,262 @@
 """Example API views demonstrating x402 payment integration on Solana."""
 
-import os
+import asyncio
 import random
 import logging
-from django.http import JsonResponse
-from django.shortcuts import render
-from django.utils import timezone
+import secrets
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from functools import lru_cache
+from django.apps import apps
+from django.core.cache import cache
+from django.http import HttpResponse
 from django.views.decorators.http import require_http_methods
 from django.conf import settings
 
 from x402_connector.django import require_payment
 
+try:
+    from solana.exceptions import SolanaRpcException
+    from solana.rpc.async_api import AsyncClient
+    from solders.pubkey import Pubkey
+    from solders.token.associated import get_associated_token_address
+    SOLANA_AVAILABLE = True
+except ImportError:
+    SOLANA_AVAILABLE = False
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+    
+    def _dumps(payload):
+        return json.dumps(payload).encode('utf-8')
+
 logger = logging.getLogger(__name__)
 
+# Balances are polled by the demo page; a few seconds of staleness is fine
+BALANCE_CACHE_TIMEOUT = 5
+# Last known balances, served when the RPC endpoint is down or too slow
+STALE_BALANCE_TIMEOUT = 300
+
+# Public RPC endpoints by network
+RPC_URLS = {
+    'solana-mainnet': 'https://api.mainnet-beta.solana.com',
+    'solana-devnet': 'https://api.devnet.solana.com',
+    'solana-testnet': 'https://api.testnet.solana.com',
+}
+
+# USDC mint addresses by network
+USDC_MINTS = {
+    'solana-mainnet': 'EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v',
+    'solana-devnet': 'Gh9ZwEmdLJ8DscKNTkTqPbNwLNNBjuSzaG9Vp2KGtKJr',
+    'solana-testnet': '8zGuJQqwhZafTah7Uc7Z4tXRnguqkn5KLFAP8oV6PHe2',
+}
+
+# Public RPC endpoints rate limit aggressively (~10 req/s); cap in-flight
+# calls per client and retry transient failures with jittered backoff
+RPC_MAX_CONCURRENCY = 8
+RPC_MAX_ATTEMPTS = 3
+RPC_BACKOFF_BASE = 0.1
+RPC_BACKOFF_MAX = 2.0
+
+# A hung endpoint must not pin the worker; after repeated failures stop
+# calling it for a while and serve stale balances instead
+RPC_TIMEOUT = 3.0
+RPC_BREAKER_FAIL_MAX = 5
+RPC_BREAKER_RESET_TIMEOUT = 30
+
+# RPC url -> (AsyncClient, Semaphore), shared on the ASGI server's loop
+_clients = {}
+# Set by start_rpc_clients() from the ASGI lifespan startup
+_server_loop = None
+
+
+# SPL token account layout: mint (32) | owner (32) | amount (u64 LE) | ...
+SPL_TOKEN_ACCOUNT_SIZE = 165
+SPL_AMOUNT_OFFSET = 64
+
+# Balances reported for wallets that aren't configured / connected
+_PLACEHOLDER_BALANCES = {
+    'hot_wallet': {'address': 'Not configured', 'sol': 0, 'usdc': 0},
+    'cold_wallet': {'address': 'Not configured', 'sol': 0, 'usdc': 0},
+    'user_wallet': {'address': 'Not connected', 'sol': 0, 'usdc': 0},
+}
+
+# Free endpoint body with only the number and timestamp filled in per request
+_RANDOM_TEMPLATE = b'{"number":%d,"range":"1-6","type":"free","timestamp":"%s"}'
+
+
+@lru_cache(maxsize=1)
+def _iso_timestamp(bucket):
+    """ISO-8601 UTC timestamp for a 100ms ``bucket`` (see ``_now_iso``)."""
+    return datetime.fromtimestamp(bucket / 10, tz=timezone.utc).isoformat()
+
+
+def _now_iso():
+    """Current UTC time as ISO-8601, formatted at most once per 100ms."""
+    return _iso_timestamp(int(time.time() * 10))
+
+
+def _json_response(payload, status=200):
+    """Return ``payload`` as an application/json response (orjson when available)."""
+    return HttpResponse(_dumps(payload), content_type='application/json', status=status)
+
+
+def _token_amount(account):
+    """Raw token amount held by an SPL token account (0 if it doesn't exist)."""
+    if account is None or len(account.data) < SPL_TOKEN_ACCOUNT_SIZE:
+        return 0
+    return int.from_bytes(
+        account.data[SPL_AMOUNT_OFFSET:SPL_AMOUNT_OFFSET + 8], 'little'
+    )
+
+
+def _balance_cache_key(network, address):
+    """Cache key for one wallet's balances on a network."""
+    return f"x402:bal:{network}:{address}"
+
+
+def _stale_balance_cache_key(network, address):
+    """Cache key for one wallet's last known balances on a network."""
+    return f"x402:bal-stale:{network}:{address}"
+
+
+class RpcUnavailableError(Exception):
+    """Raised instead of calling an RPC endpoint whose circuit is open."""
+
+
+class _CircuitBreaker:
+    """Fail fast for ``reset_timeout`` seconds after ``fail_max`` consecutive failures."""
+    
+    def __init__(self, fail_max, reset_timeout):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+    
+    def allow(self):
+        """Whether a call may be attempted right now."""
+        if self._opened_at is None:
+            return True
+        if time.monotonic() - self._opened_at < self.reset_timeout:
+            return False
+        # Half-open: let a call through; one more failure re-opens the circuit
+        self._opened_at = None
+        self._failures = self.fail_max - 1
+        return True
+    
+    def record_success(self):
+        self._failures = 0
+    
+    def record_failure(self):
+        self._failures += 1
+        if self._failures >= self.fail_max:
+            self._opened_at = time.monotonic()
+
+
+# RPC url -> _CircuitBreaker
+_breakers = {}
+
+
+@lru_cache(maxsize=256)
+def _parse_pubkey(address):
+    """Parse a base58 address, cached since the same wallets are polled repeatedly."""
+    return Pubkey.from_string(address)
+
+
+async def start_rpc_clients():
+    """Share RPC clients on the running loop (call from ASGI lifespan startup)."""
+    global _server_loop
+    _server_loop = asyncio.get_running_loop()
+
+
+async def close_rpc_clients():
+    """Close the shared RPC clients (call from ASGI lifespan shutdown)."""
+    global _server_loop
+    clients = [client for client, _ in _clients.values()]
+    _clients.clear()
+    _server_loop = None
+    for client in clients:
+        await client.close()
+
+
+@asynccontextmanager
+async def _client(rpc_url):
+    """Yield an AsyncClient and its concurrency limit for ``rpc_url``.
+    
+    On the ASGI server's loop the client is shared, keeping its HTTP
+    connections alive between requests until close_rpc_clients(). httpx
+    connections are tied to the loop that opened them, so anywhere else
+    (e.g. under WSGI, where each async view gets its own loop) a client is
+    opened for the call and closed afterwards.
+    """
+    if _server_loop is not None and asyncio.get_running_loop() is _server_loop:
+        entry = _clients.get(rpc_url)
+        if entry is None:
+            entry = _clients[rpc_url] = (
+                AsyncClient(rpc_url),
+                asyncio.Semaphore(RPC_MAX_CONCURRENCY),
+            )
+        yield entry
+    else:
+        client = AsyncClient(rpc_url)
+        try:
+            yield client, asyncio.Semaphore(RPC_MAX_CONCURRENCY)
+        finally:
+            await client.close()
+
+
+async def _rpc(rpc_url, call):
+    """Run ``call(client)`` against the client for ``rpc_url``.
+    
+    Limits concurrent requests and retries rate-limit (429) and other
+    transient RPC failures with exponential backoff and jitter. Each call
+    is bounded by ``RPC_TIMEOUT``; timeouts are not retried.
+    
+    Raises:
+        RpcUnavailableError: If the endpoint's circuit breaker is open
+        asyncio.TimeoutError: If the endpoint didn't answer in time
+    """
+    breaker = _breakers.get(rpc_url)
+    if breaker is None:
+        breaker = _breakers[rpc_url] = _CircuitBreaker(
+            RPC_BREAKER_FAIL_MAX, RPC_BREAKER_RESET_TIMEOUT
+        )
+    if not breaker.allow():
+        raise RpcUnavailableError(f"RPC endpoint {rpc_url} is unavailable")
+    
+    async with _client(rpc_url) as (client, semaphore):
+        for attempt in range(RPC_MAX_ATTEMPTS):
+            try:
+                async with semaphore:
+                    result = await asyncio.wait_for(call(client), RPC_TIMEOUT)
+                breaker.record_success()
+                return result
+            except asyncio.TimeoutError:
+                breaker.record_failure()
+                raise
+            except SolanaRpcException as e:
+                if attempt == RPC_MAX_ATTEMPTS - 1:
+                    breaker.record_failure()
+                    raise
+                delay = min(RPC_BACKOFF_MAX, RPC_BACKOFF_BASE * 2 ** attempt)
+                logger.debug(f"RPC call failed ({e}), retrying in ~{delay:.2f}s")
+                await asyncio.sleep(random.uniform(0, delay))
+
 
 # =============================================================================
 # DEMO PAGE
 # =============================================================================
 
 def index(request):
-    """Demo homepage with interactive buttons."""
-    return render(request, 'index.html')
+    """Demo homepage with interactive buttons (pre-rendered in ApiConfig.ready)."""
+    return HttpResponse(
+        apps.get_app_config('api').index_html,
+        content_type='text/html; charset=utf-8',
+    )
 
 
 # =============================================================================
@@ -28,94 +264,104 @@ def index(request):
 # =============================================================================
 
 @require_http_methods(["GET"])
-def check_balances(request):
+async def check_balances(request):
     """Check balances for hot wallet, cold wallet, and user wallet.
     
+    All wallet lookups run concurrently on a shared AsyncClient, so the
+    response takes roughly one RPC round-trip instead of one per call.
+    
     Query params:
         user_address: Optional user wallet address to check
     """
+    if not SOLANA_AVAILABLE:
+        return _json_response({
+            'error': 'Solana libraries not installed',
+            'detail': 'Install with: pip install solana solders base58',
+        }, status=500)
+    
     try:
-        from solana.rpc.api import Client
-        from solders.pubkey import Pubkey
-        
         # Get config
         network = settings.X402_CONFIG.get('network', 'solana-devnet')
-        rpc_urls = {
-            'solana-mainnet': 'https://api.mainnet-beta.solana.com',
-            'solana-devnet': 'https://api.devnet.solana.com',
-            'solana-testnet': 'https://api.testnet.solana.com',
-        }
-        rpc_url = rpc_urls.get(network, 'https://api.devnet.solana.com')
-        
-        client = Client(rpc_url)
+        rpc_url = RPC_URLS.get(network, RPC_URLS['solana-devnet'])
         
         # Get addresses
         cold_wallet = settings.X402_CONFIG.get('pay_to_address', '')
-        hot_wallet = None
-        
-        # Try to get hot wallet from signer key
-        signer_key = os.environ.get('X402_SIGNER_KEY', '')
-        if signer_key:
-            try:
-                import base58
-                from solders.keypair import Keypair
-                private_key_bytes = base58.b58decode(signer_key)
-                keypair = Keypair.from_bytes(private_key_bytes)
-                hot_wallet = str(keypair.pubkey())
-            except:
-                pass
+        # Derived from X402_SIGNER_KEY at startup (see ApiConfig.ready)
+        hot_wallet = apps.get_app_config('api').hot_wallet
         
-        # USDC mint addresses
-        usdc_mints = {
-            'solana-mainnet': 'EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v',
-            'solana-devnet': 'Gh9ZwEmdLJ8DscKNTkTqPbNwLNNBjuSzaG9Vp2KGtKJr',
-            'solana-testnet': '8zGuJQqwhZafTah7Uc7Z4tXRnguqkn5KLFAP8oV6PHe2',
-        }
-        usdc_mint = usdc_mints.get(network)
+        user_address = request.GET.get('user_address')
         
-        balances = {}
+        # Also return RPC URL for frontend to use
+        frontend_rpc_url = settings.X402_CONFIG.get('rpc_url') or rpc_url
         
-        # Check hot wallet balances
+        # Wallets that actually need an RPC lookup
+        wallets = {}
         if hot_wallet and not hot_wallet.startswith('REPLACE'):
-            balances['hot_wallet'] = _get_wallet_balances(client, hot_wallet, usdc_mint)
-            balances['hot_wallet']['address'] = hot_wallet
-        else:
-            balances['hot_wallet'] = {'address': 'Not configured', 'sol': 0, 'usdc': 0}
-        
-        # Check cold wallet balances
+            wallets['hot_wallet'] = hot_wallet
         if cold_wallet and not cold_wallet.startswith('REPLACE'):
-            balances['cold_wallet'] = _get_wallet_balances(client, cold_wallet, usdc_mint)
-            balances['cold_wallet']['address'] = cold_wallet
-        else:
-            balances['cold_wallet'] = {'address': 'Not configured', 'sol': 0, 'usdc': 0}
-        
-        # Check user wallet if provided
-        user_address = request.GET.get('user_address')
+            wallets['cold_wallet'] = cold_wallet
         if user_address:
-            balances['user_wallet'] = _get_wallet_balances(client, user_address, usdc_mint)
-            balances['user_wallet']['address'] = user_address
-        else:
-            balances['user_wallet'] = {'address': 'Not connected', 'sol': 0, 'usdc': 0}
+            wallets['user_wallet'] = user_address
         
-        # Also return RPC URL for frontend to use
-        rpc_url = rpc_urls.get(network, 'https://api.devnet.solana.com')
-        if settings.X402_CONFIG.get('rpc_url'):
-            rpc_url = settings.X402_CONFIG['rpc_url']
+        # Unconfigured demo (the default): nothing to look up
+        if not wallets:
+            return _json_response({
+                'balances': _PLACEHOLDER_BALANCES,
+                'network': network,
+                'rpc_url': frontend_rpc_url,
+                'timestamp': _now_iso(),
+            })
+        
+        usdc_mint = USDC_MINTS.get(network)
+        balances = dict(_PLACEHOLDER_BALANCES)
+        
+        keys = {
+            address: _balance_cache_key(network, address)
+            for address in wallets.values()
+        }
+        cached = await cache.aget_many(keys.values())
+        missing = [address for address, key in keys.items() if key not in cached]
+        
+        if missing:
+            try:
+                results = await _get_wallet_balances(rpc_url, missing, usdc_mint)
+            except (asyncio.TimeoutError, RpcUnavailableError, SolanaRpcException) as e:
+                logger.warning(f"Balance lookup failed ({e!r}), serving stale balances")
+                results = await _get_stale_balances(network, missing)
+            else:
+                fetched = {
+                    address: result
+                    for address, result in zip(missing, results)
+                    if 'error' not in result
+                }
+                await cache.aset_many(
+                    {keys[address]: result for address, result in fetched.items()},
+                    timeout=BALANCE_CACHE_TIMEOUT,
+                )
+                await cache.aset_many(
+                    {
+                        _stale_balance_cache_key(network, address): result
+                        for address, result in fetched.items()
+                    },
+                    timeout=STALE_BALANCE_TIMEOUT,
+                )
+            
+            cached.update(
+                (keys[address], result) for address, result in zip(missing, results)
+            )
         
-        return JsonResponse({
+        for name, address in wallets.items():
+            balances[name] = {**cached[keys[address]], 'address': address}
+        
+        return _json_response({
             'balances': balances,
             'network': network,
-            'rpc_url': rpc_url,  # Frontend will use this
-            'timestamp': timezone.now().isoformat(),
+            'rpc_url': frontend_rpc_url,  # Frontend will use this
+            'timestamp': _now_iso(),
         })
         
-    except ImportError:
-        return JsonResponse({
-            'error': 'Solana libraries not installed',
-            'detail': 'Install with: pip install solana solders base58',
-        }, status=500)
     except Exception as e:
-        return JsonResponse({
+        return _json_response({
             'error': str(e),
             'balances': {
                 'hot_wallet': {'address': 'Error checking', 'sol': 0, 'usdc': 0},
@@ -125,41 +371,73 @@ def check_balances(request):
         })
 
 
-def _get_wallet_balances(client, address_str, usdc_mint):
-    """Get SOL and USDC balances for an address."""
-    try:
-        from solders.pubkey import Pubkey
-        from solders.token.associated import get_associated_token_address
-        
-        pubkey = Pubkey.from_string(address_str)
-        
-        # Get SOL balance
-        sol_balance = client.get_balance(pubkey).value / 1_000_000_000  # lamports to SOL
+async def _get_stale_balances(network, addresses):
+    """Last known balances for ``addresses``, flagged with ``'stale': True``.
+    
+    Wallets without a stale entry get zero balances and an error message.
+    """
+    keys = [_stale_balance_cache_key(network, address) for address in addresses]
+    stale = await cache.aget_many(keys)
+    return [
+        {**stale[key], 'stale': True} if key in stale
+        else {'sol': 0, 'usdc': 0, 'error': 'RPC endpoint unavailable'}
+        for key in keys
+    ]
+
+
+async def _get_wallet_balances(rpc_url, addresses, usdc_mint):
+    """Get SOL and USDC balances for a list of addresses.
+    
+    The wallets and their USDC token accounts are fetched together in a
+    single getMultipleAccounts request, i.e. one RPC round-trip in total
+    instead of two RPC calls per wallet.
+    
+    Returns:
+        List of balance dicts in the same order as ``addresses``
+    """
+    results = [None] * len(addresses)
+    pubkeys = []
+    indexes = []
+    for i, address in enumerate(addresses):
+        try:
+            pubkeys.append(_parse_pubkey(address))
+            indexes.append(i)
+        except ValueError as e:
+            results[i] = {'sol': 0, 'usdc': 0, 'error': str(e)}
+    
+    if not pubkeys:
+        return results
+    
+    token_accounts = []
+    if usdc_mint:
+        # Only associated token accounts are read. getTokenAccountsByOwner
+        # would also find USDC held in other token accounts, but costs one
+        # RPC per wallet; a missing ATA simply comes back as None (zero USDC).
+        usdc_mint_pubkey = _parse_pubkey(usdc_mint)
+        token_accounts = [
+            get_associated_token_address(pubkey, usdc_mint_pubkey) for pubkey in pubkeys
+        ]
+    
+    # Accounts come back in request order: wallets first, then token accounts
+    resp = await _rpc(
+        rpc_url, lambda client: client.get_multiple_accounts(pubkeys + token_accounts)
+    )
+    wallet_accounts = resp.value[:len(pubkeys)]
+    usdc_accounts = resp.value[len(pubkeys):] or [None] * len(pubkeys)
+    
+    for i, account, token_account in zip(indexes, wallet_accounts, usdc_accounts):
+        # Unfunded wallets come back as None
+        lamports = account.lamports if account is not None else 0
         
-        # Get USDC balance
-        usdc_balance = 0.0
-        if usdc_mint:
-            try:
-                # Get associated token account address
-                usdc_mint_pubkey = Pubkey.from_string(usdc_mint)
-                token_account = get_associated_token_address(pubkey, usdc_mint_pubkey)
-                
-                # Get token account balance
-                token_response = client.get_token_account_balance(token_account)
-                if token_response.value:
-                    # Convert from atomic units (USDC has 6 decimals)
-                    usdc_balance = float(token_response.value.amount) / 1_000_000
-            except Exception as e:
-                # Token account might not exist yet (no USDC held)
-                logger.debug(f"No USDC account for {address_str[:8]}...: {e}")
-                usdc_balance = 0.0
+        # Convert from atomic units (USDC has 6 decimals)
+        usdc_balance = _token_amount(token_account) / 1_000_000
         
-        return {
-            'sol': round(sol_balance, 6),
+        results[i] = {
+            'sol': round(lamports / 1_000_000_000, 6),  # lamports to SOL
             'usdc': round(usdc_balance, 2),
         }
-    except Exception as e:
-        return {'sol': 0, 'usdc': 0, 'error': str(e)}
+    
+    return results
 
 
 # =============================================================================
@@ -167,19 +445,17 @@ def _get_wallet_balances(client, address_str, usdc_mint):
 # =============================================================================
 
 @require_http_methods(["GET"])
-def random_number(request):
+async def random_number(request):
     """Free random number generator (1-6).
     
     No payment required - publicly accessible.
     """
     number = random.randint(1, 6)
     
-    return JsonResponse({
-        'number': number,
-        'range': '1-6',
-        'type': 'free',
-        'timestamp': timezone.now().isoformat(),
-    })
+    return HttpResponse(
+        _RANDOM_TEMPLATE % (number, _now_iso().encode('ascii')),
+        content_type='application/json',
+    )
 
 
 @require_http_methods(["GET"])
@@ -190,13 +466,21 @@ def premium_random_number(request):
     Requires payment via x402 protocol on Solana blockchain.
     Payment is handled automatically by the @require_payment decorator.
     """
-    number = random.randint(1000000, 9999999)
+    # Paid output: use the OS CSPRNG so results can't be predicted from
+    # earlier responses (Mersenne Twister state is recoverable)
+    number = 1_000_000 + secrets.randbelow(9_000_000)
+    
+    # The payment lands in the cold wallet; don't serve its stale balance
+    cache.delete(_balance_cache_key(
+        settings.X402_CONFIG.get('network', 'solana-devnet'),
+        settings.X402_CONFIG.get('pay_to_address', ''),
+    ))
     
-    return JsonResponse({
+    return _json_response({
         'number': number,
         'range': '1000000-9999999',
         'type': 'premium',
         'digits': 7,
-        'timestamp': timezone.now().isoformat(),
+        'timestamp': _now_iso(),
         'note': 'This number required payment!',
     })
@@ -0,0 +1,38 @@
+"""
+ASGI config for x402-connector Django example.
+
+It exposes the ASGI callable as a module-level variable named ``application``.
+Run with an ASGI server so the async views share one event loop:
+
+    uvicorn config.asgi:application
+"""
+
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+django_application = get_asgi_application()
+
+from api.views import close_rpc_clients, start_rpc_clients  # noqa: E402  (needs Django set up)
+
+
+async def application(scope, receive, send):
+    """Django's ASGI app, plus lifespan events for the shared RPC clients.
+
+    Django itself rejects lifespan scopes, so they are handled here: RPC
+    clients are shared on the server loop from startup and closed on shutdown.
+    """
+    if scope['type'] != 'lifespan':
+        return await django_application(scope, receive, send)
+
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            await start_rpc_clients()
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            await close_rpc_clients()
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
@@ -4,15 +4,50 @@ This demonstrates how to integrate x402 payment requirements
 into a Django application using Solana blockchain.
 """
 
+import json
 import os
 from pathlib import Path
 
+
+def _fast_load_dotenv(path):
+    """Load ``path`` into os.environ, caching the parsed variables.
+    
+    The parsed values are stored in a sibling ``.env.cache`` (JSON, mode
+    0600) keyed on the file's mtime, so restarts (e.g. --reload) skip
+    parsing until .env changes. Existing variables are not overridden.
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return
+    
+    cache_path = os.path.join(os.path.dirname(path), '.env.cache')
+    values = None
+    try:
+        with open(cache_path) as f:
+            cached = json.load(f)
+        if cached['mtime_ns'] == mtime_ns:
+            values = cached['values']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    
+    if values is None:
+        values = {k: v for k, v in dotenv_values(path).items() if v is not None}
+        try:
+            fd = os.open(cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'mtime_ns': mtime_ns, 'values': values}, f)
+        except OSError:
+            pass
+    
+    for key, value in values.items():
+        os.environ.setdefault(key, value)
+
+
 # Load environment variables from .env file
 try:
-    from dotenv import load_dotenv
-    env_path = Path(__file__).resolve().parent.parent / '.env'
-    if env_path.exists():
-        load_dotenv(env_path)
+    from dotenv import dotenv_values
+    _fast_load_dotenv(os.fspath(Path(__file__).resolve().parent.parent / '.env'))
 except ImportError:
     pass
 
@@ -63,6 +98,7 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'config.wsgi.application'
+ASGI_APPLICATION = 'config.asgi.application'
 
 # Database
 DATABASES = {
@@ -72,6 +108,22 @@ DATABASES = {
     }
 }
 
+# Cache (used for short-lived wallet balance lookups)
+# Set REDIS_URL to share the cache between worker processes
+if os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 # Internationalization
 LANGUAGE_CODE = 'en-us'
 TIME_ZONE = 'UTC'
@@ -149,20 +201,3 @@ X402_CONFIG = {
     'use_durable_nonce': os.getenv('X402_USE_DURABLE_NONCE', 'False').lower() == 'true',
     'nonce_account_env': 'X402_NONCE_ACCOUNT',
 }
-
-# Display current configuration
-print("=" * 70)
-print("x402-connector - Solana Payment SDK")
-print("=" * 70)
-print(f"Network:        {X402_CONFIG.get('network')}")
-print(f"Pay To:         {X402_CONFIG.get('pay_to_address')}")
-print(f"Default Price:  {X402_CONFIG.get('price')}")
-print("=" * 70)
-
-# Validate configuration
-pay_to = X402_CONFIG.get('pay_to_address', '')
-if not pay_to or len(pay_to) < 32 or pay_to.startswith('REPLACE'):
-    print("⚠️  WARNING: X402_PAY_TO_ADDRESS is not properly configured!")
-    print("   Set a valid Solana address (base58 format, 32-44 chars)")
-    print("   Set environment variable: X402_PAY_TO_ADDRESS=YourAddress")
-    print("=" * 70)
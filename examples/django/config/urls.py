@@ -1,11 +1,16 @@
 """URL configuration for x402-connector Django example."""
 
-from django.urls import path, include
+from django.urls import path
+from api import urls as api_urls
 from api.views import index
 
 
 urlpatterns = [
     path('', index, name='index'),
-    path('api/', include('api.urls')),
+    # API routes mounted under 'api/' directly rather than via include(),
+    # so requests are matched without a nested resolver
+    *(
+        path(f'api/{pattern.pattern}', pattern.callback, name=pattern.name)
+        for pattern in api_urls.urlpatterns
+    ),
 ]
-
@@ -5,32 +5,124 @@ into a FastAPI application using Solana blockchain.
 """
 
 import os
+import json
 import random
 import logging
+import secrets
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional
 from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from dotenv import load_dotenv
+from jinja2 import FileSystemBytecodeCache
+from dotenv import dotenv_values
 
 from x402_connector.fastapi import X402Middleware, require_payment
 
+try:
+    import base58
+    from solana.rpc.async_api import AsyncClient
+    from solders.keypair import Keypair
+    from solders.pubkey import Pubkey
+    from solders.token.associated import get_associated_token_address
+    SOLANA_AVAILABLE = True
+except ImportError:
+    SOLANA_AVAILABLE = False
+
+
+def _fast_load_dotenv(path):
+    """Load ``path`` into os.environ, caching the parsed variables.
+    
+    The parsed values are stored in a sibling ``.env.cache`` (JSON, mode
+    0600) keyed on the file's mtime, so restarts (e.g. --reload) skip
+    parsing until .env changes. Existing variables are not overridden.
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return
+    
+    cache_path = os.path.join(os.path.dirname(path), '.env.cache')
+    values = None
+    try:
+        with open(cache_path) as f:
+            cached = json.load(f)
+        if cached['mtime_ns'] == mtime_ns:
+            values = cached['values']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    
+    if values is None:
+        values = {k: v for k, v in dotenv_values(path).items() if v is not None}
+        try:
+            fd = os.open(cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'mtime_ns': mtime_ns, 'values': values}, f)
+        except OSError:
+            pass
+    
+    for key, value in values.items():
+        os.environ.setdefault(key, value)
+
+
 # Load environment variables from .env file
-env_path = os.path.join(os.path.dirname(__file__), '.env')
-if os.path.exists(env_path):
-    load_dotenv(env_path)
+_fast_load_dotenv(os.path.join(os.path.dirname(__file__), '.env'))
+
+
+@dataclass(frozen=True)
+class _Env:
+    """Environment settings, read once at import instead of per request."""
+    
+    network: str
+    pay_to: str
+    price: str
+    rpc_url: Optional[str]
+    signer_key: str
+    debug_mode: bool
+    use_durable_nonce: bool
+    fastapi_debug: bool
+
+
+_ENV = _Env(
+    network=os.getenv('X402_NETWORK', 'solana-devnet'),
+    pay_to=os.getenv('X402_PAY_TO_ADDRESS', 'REPLACE_WITH_YOUR_SOLANA_ADDRESS_44_CHARS'),
+    price=os.getenv('X402_PRICE', '$0.01'),
+    rpc_url=os.getenv('X402_RPC_URL'),
+    signer_key=os.getenv('X402_SIGNER_KEY', ''),
+    debug_mode=os.getenv('X402_DEBUG_MODE', 'True').lower() == 'true',
+    use_durable_nonce=os.getenv('X402_USE_DURABLE_NONCE', 'False').lower() == 'true',
+    fastapi_debug=os.getenv('FASTAPI_DEBUG', 'False') == 'True',
+)
+
+
+@asynccontextmanager
+async def lifespan(app):
+    """Close the shared RPC clients on shutdown."""
+    yield
+    for client in _rpc_clients.values():
+        await client.close()
+    _rpc_clients.clear()
+
 
 # Initialize FastAPI app
 app = FastAPI(
     title="x402 Random Number Generator",
     description="FastAPI + Solana Micropayments Demo",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    # orjson serializes the polled balance payload much faster than json
+    default_response_class=ORJSONResponse,
 )
 
 # Configure logging
 logging.basicConfig(
-    level=logging.DEBUG if os.getenv('FASTAPI_DEBUG', 'False') == 'True' else logging.INFO,
+    level=logging.DEBUG if _ENV.fastapi_debug else logging.INFO,
     format='%(levelname)s %(asctime)s %(module)s %(message)s',
 )
 logger = logging.getLogger(__name__)
@@ -42,16 +134,13 @@ logger = logging.getLogger(__name__)
 app.add_middleware(
     X402Middleware,
     # Required: Your Solana address for receiving payments
-    pay_to_address=os.getenv(
-        'X402_PAY_TO_ADDRESS',
-        'REPLACE_WITH_YOUR_SOLANA_ADDRESS_44_CHARS'
-    ),
+    pay_to_address=_ENV.pay_to,
     
     # Optional: Default price
-    price=os.getenv('X402_PRICE', '$0.01'),
+    price=_ENV.price,
     
     # Optional: Solana network
-    network=os.getenv('X402_NETWORK', 'solana-devnet'),
+    network=_ENV.network,
     
     # Protected paths - empty by default, use @require_payment() decorator instead
     protected_paths=[],
@@ -60,35 +149,126 @@ app.add_middleware(
     description='Premium Random Number API',
     
     # Debug mode (True = simulated, False = requires pre-signed transactions)
-    debug_mode=os.getenv('X402_DEBUG_MODE', 'True').lower() == 'true',
+    debug_mode=_ENV.debug_mode,
     
     # Optional: Custom RPC URL
-    rpc_url=os.getenv('X402_RPC_URL'),
+    rpc_url=_ENV.rpc_url,
     
     # Optional: Durable nonce
-    use_durable_nonce=os.getenv('X402_USE_DURABLE_NONCE', 'False').lower() == 'true',
+    use_durable_nonce=_ENV.use_durable_nonce,
     nonce_account_env='X402_NONCE_ACCOUNT',
 )
 
 # Setup templates
 templates = Jinja2Templates(directory=os.path.join(os.path.dirname(__file__), "templates"))
+if not _ENV.fastapi_debug:
+    # Templates don't change in production: skip the per-render stat of the
+    # template file and keep compiled bytecode across restarts
+    templates.env.auto_reload = False
+    templates.env.bytecode_cache = FileSystemBytecodeCache()
+
+# Log current configuration once: the flag is inherited by processes started
+# after this import (e.g. uvicorn's reload/worker processes when run via
+# `python app.py`), which import this module again
+if not os.environ.get('X402_BANNER_SHOWN'):
+    os.environ['X402_BANNER_SHOWN'] = '1'
+    
+    logger.info("\n".join([
+        "x402-connector - Solana Payment SDK",
+        f"Network:        {_ENV.network}",
+        f"Pay To:         {_ENV.pay_to}",
+        f"Default Price:  {_ENV.price}",
+    ]))
+
+# Validate configuration (in every process, unlike the banner)
+if not _ENV.pay_to or len(_ENV.pay_to) < 32 or _ENV.pay_to.startswith('REPLACE'):
+    logger.warning(
+        "X402_PAY_TO_ADDRESS is not properly configured! "
+        "Set a valid Solana address (base58 format, 32-44 chars)"
+    )
+
+
+# Public RPC endpoints by network
+_RPC_URLS = MappingProxyType({
+    'solana-mainnet': 'https://api.mainnet-beta.solana.com',
+    'solana-devnet': 'https://api.devnet.solana.com',
+    'solana-testnet': 'https://api.testnet.solana.com',
+})
+
+# USDC mint addresses by network
+_USDC_MINTS = MappingProxyType({
+    'solana-mainnet': 'EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v',
+    'solana-devnet': 'Gh9ZwEmdLJ8DscKNTkTqPbNwLNNBjuSzaG9Vp2KGtKJr',
+    'solana-testnet': '8zGuJQqwhZafTah7Uc7Z4tXRnguqkn5KLFAP8oV6PHe2',
+})
+
+# Resolved once for the configured network
+_RPC_URL = _RPC_URLS.get(_ENV.network, _RPC_URLS['solana-devnet'])
+_USDC_MINT = _USDC_MINTS.get(_ENV.network)
+# RPC URL returned to the frontend (custom X402_RPC_URL if set)
+_FRONTEND_RPC_URL = _ENV.rpc_url or _RPC_URL
+
+
+@lru_cache(maxsize=1)
+def _iso_timestamp(bucket):
+    """ISO-8601 UTC timestamp for the epoch second ``bucket`` (see ``_now_iso``)."""
+    return datetime.utcfromtimestamp(bucket).isoformat()
+
+
+def _now_iso():
+    """Current UTC time as ISO-8601, formatted at most once per second."""
+    return _iso_timestamp(int(time.time()))
+
+
+# SPL token account layout: mint (32) | owner (32) | amount (u64 LE) | ...
+SPL_TOKEN_ACCOUNT_SIZE = 165
+SPL_AMOUNT_OFFSET = 64
+
 
-# Display current configuration
-print("=" * 70)
-print("x402-connector - Solana Payment SDK")
-print("=" * 70)
-print(f"Network:        {os.getenv('X402_NETWORK', 'solana-devnet')}")
-print(f"Pay To:         {os.getenv('X402_PAY_TO_ADDRESS', 'NOT SET')}")
-print(f"Default Price:  {os.getenv('X402_PRICE', '$0.01')}")
-print("=" * 70)
+def _token_amount(account):
+    """Raw token amount held by an SPL token account (0 if it doesn't exist)."""
+    if account is None or len(account.data) < SPL_TOKEN_ACCOUNT_SIZE:
+        return 0
+    return int.from_bytes(
+        account.data[SPL_AMOUNT_OFFSET:SPL_AMOUNT_OFFSET + 8], 'little'
+    )
+
+
+# Per-process generator for the free endpoint
+_RNG = random.Random()
+
+
+# RPC url -> AsyncClient, shared so HTTP connections stay alive
+_rpc_clients = {}
+
+
+def _rpc_client(rpc_url):
+    """Shared async RPC client for ``rpc_url`` (closed on shutdown)."""
+    client = _rpc_clients.get(rpc_url)
+    if client is None:
+        client = _rpc_clients[rpc_url] = AsyncClient(rpc_url)
+    return client
+
+
+@lru_cache(maxsize=512)
+def _parse_pubkey(address):
+    """Parse a base58 address, cached since the UI polls the same wallets."""
+    return Pubkey.from_string(address)
+
+
+def _derive_hot_wallet(signer_key):
+    """Public address for the base58 ``signer_key``, or None if unavailable."""
+    if not signer_key or not SOLANA_AVAILABLE:
+        return None
+    try:
+        return str(Keypair.from_bytes(base58.b58decode(signer_key)).pubkey())
+    except ValueError as e:
+        logger.warning(f"X402_SIGNER_KEY is not a valid base58 keypair: {e}")
+        return None
 
-# Validate configuration
-pay_to = os.getenv('X402_PAY_TO_ADDRESS', '')
-if not pay_to or len(pay_to) < 32 or pay_to.startswith('REPLACE'):
-    print("⚠️  WARNING: X402_PAY_TO_ADDRESS is not properly configured!")
-    print("   Set a valid Solana address (base58 format, 32-44 chars)")
-    print("   Set environment variable: X402_PAY_TO_ADDRESS=YourAddress")
-    print("=" * 70)
+
+# Hot wallet (server signer) address, derived once instead of per request
+_HOT_WALLET_ADDRESS = _derive_hot_wallet(_ENV.signer_key)
 
 
 # =============================================================================
@@ -105,7 +285,6 @@ async def index(request: Request):
 # BALANCE CHECK API
 # =============================================================================
 
-@app.get("/api/balances")
 async def check_balances(user_address: str = None):
     """Check balances for hot wallet, cold wallet, and user wallet.
     
@@ -113,84 +292,39 @@ async def check_balances(user_address: str = None):
         user_address: Optional user wallet address to check
     """
     try:
-        from solana.rpc.api import Client
-        from solders.pubkey import Pubkey
-        
-        # Get config
-        network = os.getenv('X402_NETWORK', 'solana-devnet')
-        rpc_urls = {
-            'solana-mainnet': 'https://api.mainnet-beta.solana.com',
-            'solana-devnet': 'https://api.devnet.solana.com',
-            'solana-testnet': 'https://api.testnet.solana.com',
-        }
-        rpc_url = rpc_urls.get(network, 'https://api.devnet.solana.com')
-        
-        client = Client(rpc_url)
+        client = _rpc_client(_RPC_URL)
         
         # Get addresses
-        cold_wallet = os.getenv('X402_PAY_TO_ADDRESS', '')
-        hot_wallet = None
-        
-        # Try to get hot wallet from signer key
-        signer_key = os.environ.get('X402_SIGNER_KEY', '')
-        if signer_key:
-            try:
-                import base58
-                from solders.keypair import Keypair
-                private_key_bytes = base58.b58decode(signer_key)
-                keypair = Keypair.from_bytes(private_key_bytes)
-                hot_wallet = str(keypair.pubkey())
-            except:
-                pass
+        cold_wallet = _ENV.pay_to
+        hot_wallet = _HOT_WALLET_ADDRESS
         
-        # USDC mint addresses
-        usdc_mints = {
-            'solana-mainnet': 'EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v',
-            'solana-devnet': 'Gh9ZwEmdLJ8DscKNTkTqPbNwLNNBjuSzaG9Vp2KGtKJr',
-            'solana-testnet': '8zGuJQqwhZafTah7Uc7Z4tXRnguqkn5KLFAP8oV6PHe2',
+        balances = {
+            'hot_wallet': {'address': 'Not configured', 'sol': 0, 'usdc': 0},
+            'cold_wallet': {'address': 'Not configured', 'sol': 0, 'usdc': 0},
+            'user_wallet': {'address': 'Not connected', 'sol': 0, 'usdc': 0},
         }
-        usdc_mint = usdc_mints.get(network)
-        
-        balances = {}
         
-        # Check hot wallet balances
+        # Wallets that actually need an RPC lookup
+        wallets = {}
         if hot_wallet and not hot_wallet.startswith('REPLACE'):
-            balances['hot_wallet'] = _get_wallet_balances(client, hot_wallet, usdc_mint)
-            balances['hot_wallet']['address'] = hot_wallet
-        else:
-            balances['hot_wallet'] = {'address': 'Not configured', 'sol': 0, 'usdc': 0}
-        
-        # Check cold wallet balances
+            wallets['hot_wallet'] = hot_wallet
         if cold_wallet and not cold_wallet.startswith('REPLACE'):
-            balances['cold_wallet'] = _get_wallet_balances(client, cold_wallet, usdc_mint)
-            balances['cold_wallet']['address'] = cold_wallet
-        else:
-            balances['cold_wallet'] = {'address': 'Not configured', 'sol': 0, 'usdc': 0}
-        
-        # Check user wallet if provided
+            wallets['cold_wallet'] = cold_wallet
         if user_address:
-            balances['user_wallet'] = _get_wallet_balances(client, user_address, usdc_mint)
-            balances['user_wallet']['address'] = user_address
-        else:
-            balances['user_wallet'] = {'address': 'Not connected', 'sol': 0, 'usdc': 0}
+            wallets['user_wallet'] = user_address
         
-        # Also return RPC URL for frontend to use
-        rpc_url = rpc_urls.get(network, 'https://api.devnet.solana.com')
-        if os.getenv('X402_RPC_URL'):
-            rpc_url = os.getenv('X402_RPC_URL')
+        if wallets:
+            results = await _get_wallet_balances(client, list(wallets.values()), _USDC_MINT)
+            for (name, address), result in zip(wallets.items(), results):
+                balances[name] = {**result, 'address': address}
         
         return {
             'balances': balances,
-            'network': network,
-            'rpc_url': rpc_url,
-            'timestamp': datetime.utcnow().isoformat(),
+            'network': _ENV.network,
+            'rpc_url': _FRONTEND_RPC_URL,
+            'timestamp': _now_iso(),
         }
         
-    except ImportError:
-        return {
-            'error': 'Solana libraries not installed',
-            'detail': 'Install with: pip install solana solders base58',
-        }
     except Exception as e:
         return {
             'error': str(e),
@@ -202,36 +336,68 @@ async def check_balances(user_address: str = None):
         }
 
 
-def _get_wallet_balances(client, address_str, usdc_mint):
-    """Get SOL and USDC balances for an address."""
-    try:
-        from solders.pubkey import Pubkey
-        from solders.token.associated import get_associated_token_address
-        
-        pubkey = Pubkey.from_string(address_str)
-        
-        # Get SOL balance
-        sol_balance = client.get_balance(pubkey).value / 1_000_000_000
-        
-        # Get USDC balance
-        usdc_balance = 0.0
-        if usdc_mint:
-            try:
-                usdc_mint_pubkey = Pubkey.from_string(usdc_mint)
-                token_account = get_associated_token_address(pubkey, usdc_mint_pubkey)
-                token_response = client.get_token_account_balance(token_account)
-                if token_response.value:
-                    usdc_balance = float(token_response.value.amount) / 1_000_000
-            except Exception as e:
-                logger.debug(f"No USDC account for {address_str[:8]}...: {e}")
-                usdc_balance = 0.0
+async def _get_wallet_balances(client, addresses, usdc_mint):
+    """Get SOL and USDC balances for a list of addresses.
+    
+    The wallets and their USDC token accounts are fetched in a single
+    getMultipleAccounts request instead of two RPC calls per wallet.
+    
+    Returns:
+        List of balance dicts in the same order as ``addresses``
+    """
+    results = [None] * len(addresses)
+    pubkeys = []
+    indexes = []
+    for i, address in enumerate(addresses):
+        try:
+            pubkeys.append(_parse_pubkey(address))
+            indexes.append(i)
+        except ValueError as e:
+            results[i] = {'sol': 0, 'usdc': 0, 'error': str(e)}
+    
+    if not pubkeys:
+        return results
+    
+    token_accounts = []
+    if usdc_mint:
+        usdc_mint_pubkey = _parse_pubkey(usdc_mint)
+        token_accounts = [
+            get_associated_token_address(pubkey, usdc_mint_pubkey) for pubkey in pubkeys
+        ]
+    
+    # Accounts come back in request order: wallets first, then token accounts
+    accounts = (await client.get_multiple_accounts(pubkeys + token_accounts)).value
+    wallet_accounts = accounts[:len(pubkeys)]
+    usdc_accounts = accounts[len(pubkeys):] or [None] * len(pubkeys)
+    
+    for i, account, token_account in zip(indexes, wallet_accounts, usdc_accounts):
+        # Unfunded wallets and missing token accounts come back as None
+        lamports = account.lamports if account is not None else 0
+        usdc_amount = _token_amount(token_account)
         
-        return {
-            'sol': round(sol_balance, 6),
-            'usdc': round(usdc_balance, 2),
+        # Unrounded: the demo page formats with toFixed(6) / toFixed(2)
+        results[i] = {
+            'sol': lamports / 1_000_000_000,
+            'usdc': usdc_amount / 1_000_000,  # USDC has 6 decimals
         }
-    except Exception as e:
-        return {'sol': 0, 'usdc': 0, 'error': str(e)}
+    
+    return results
+
+
+async def check_balances_unavailable():
+    """Stand-in for check_balances when the Solana libraries are missing."""
+    return {
+        'error': 'Solana libraries not installed',
+        'detail': 'Install with: pip install solana solders base58',
+    }
+
+
+# Chosen once at startup, so requests never go through an import check
+app.add_api_route(
+    "/api/balances",
+    check_balances if SOLANA_AVAILABLE else check_balances_unavailable,
+    methods=["GET"],
+)
 
 
 # =============================================================================
@@ -244,13 +410,13 @@ async def random_number():
     
     No payment required - publicly accessible.
     """
-    number = random.randint(1, 6)
+    number = _RNG.randrange(1, 7)
     
     return {
         'number': number,
         'range': '1-6',
         'type': 'free',
-        'timestamp': datetime.utcnow().isoformat(),
+        'timestamp': _now_iso(),
     }
 
 
@@ -262,16 +428,19 @@ async def premium_random_number(request: Request):
     Requires payment via x402 protocol on Solana blockchain.
     Payment is handled automatically by the @require_payment decorator.
     """
-    number = random.randint(1000000, 9999999)
+    # Paid output: use the OS CSPRNG so results can't be predicted from
+    # earlier responses (Mersenne Twister state is recoverable)
+    number = 1_000_000 + secrets.randbelow(9_000_000)
     
-    return {
+    # Returned as a response so @require_payment doesn't re-wrap it in JSONResponse
+    return ORJSONResponse(content={
         'number': number,
         'range': '1000000-9999999',
         'type': 'premium',
         'digits': 7,
-        'timestamp': datetime.utcnow().isoformat(),
+        'timestamp': _now_iso(),
         'note': 'This number required payment!',
-    }
+    })
 
 
 if __name__ == "__main__":
@@ -282,6 +451,6 @@ if __name__ == "__main__":
         "app:app",
         host="0.0.0.0",
         port=port,
-        reload=os.getenv('FASTAPI_DEBUG', 'False') == 'True'
+        reload=_ENV.fastapi_debug
     )
 
@@ -7,23 +7,113 @@ into a Pyramid application using Solana blockchain.
 import os
 import random
 import logging
-import json
-from wsgiref.simple_server import make_server
+import secrets
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional
 from pyramid.config import Configurator
 from pyramid.response import Response
 from pyramid.view import view_config
-from dotenv import load_dotenv
+from waitress import serve
+from dotenv import dotenv_values
 
 from x402_connector.pyramid import require_payment, includeme
 
+try:
+    import base58
+    from solana.rpc.api import Client
+    from solders.keypair import Keypair
+    from solders.pubkey import Pubkey
+    from solders.token.associated import get_associated_token_address
+    SOLANA_AVAILABLE = True
+except ImportError:
+    SOLANA_AVAILABLE = False
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+    
+    def _dumps(payload):
+        return json.dumps(payload).encode('utf-8')
+
+
+def _fast_load_dotenv(path):
+    """Load ``path`` into os.environ, caching the parsed variables.
+    
+    The parsed values are stored in a sibling ``.env.cache`` (JSON, mode
+    0600) keyed on the file's mtime, so restarts (e.g. --reload) skip
+    parsing until .env changes. Existing variables are not overridden.
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return
+    
+    cache_path = os.path.join(os.path.dirname(path), '.env.cache')
+    values = None
+    try:
+        with open(cache_path) as f:
+            cached = json.load(f)
+        if cached['mtime_ns'] == mtime_ns:
+            values = cached['values']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    
+    if values is None:
+        values = {k: v for k, v in dotenv_values(path).items() if v is not None}
+        try:
+            fd = os.open(cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'mtime_ns': mtime_ns, 'values': values}, f)
+        except OSError:
+            pass
+    
+    for key, value in values.items():
+        os.environ.setdefault(key, value)
+
+
 # Load environment variables from .env file
-env_path = os.path.join(os.path.dirname(__file__), '.env')
-if os.path.exists(env_path):
-    load_dotenv(env_path)
+_fast_load_dotenv(os.path.join(os.path.dirname(__file__), '.env'))
+
+
+@dataclass(frozen=True)
+class _Env:
+    """Environment settings, read once at import instead of per request."""
+    
+    network: str
+    pay_to: str
+    price: str
+    rpc_url: Optional[str]
+    signer_key: str
+    debug_mode: bool
+    use_durable_nonce: bool
+    pyramid_debug: bool
+    port: int
+    threads: int
+
+
+_ENV = _Env(
+    network=os.getenv('X402_NETWORK', 'solana-devnet'),
+    pay_to=os.getenv('X402_PAY_TO_ADDRESS', 'REPLACE_WITH_YOUR_SOLANA_ADDRESS_44_CHARS'),
+    price=os.getenv('X402_PRICE', '$0.01'),
+    rpc_url=os.getenv('X402_RPC_URL'),
+    signer_key=os.getenv('X402_SIGNER_KEY', ''),
+    debug_mode=os.getenv('X402_DEBUG_MODE', 'True').lower() == 'true',
+    use_durable_nonce=os.getenv('X402_USE_DURABLE_NONCE', 'False').lower() == 'true',
+    pyramid_debug=os.getenv('PYRAMID_DEBUG', 'False') == 'True',
+    port=int(os.getenv('PORT', '6543')),
+    threads=int(os.getenv('WAITRESS_THREADS', '16')),
+)
 
 # Configure logging
 logging.basicConfig(
-    level=logging.DEBUG if os.getenv('PYRAMID_DEBUG', 'False') == 'True' else logging.INFO,
+    level=logging.DEBUG if _ENV.pyramid_debug else logging.INFO,
     format='%(levelname)s %(asctime)s %(module)s %(message)s',
 )
 logger = logging.getLogger(__name__)
@@ -33,184 +123,250 @@ logger = logging.getLogger(__name__)
 # VIEW FUNCTIONS
 # =============================================================================
 
+@lru_cache(maxsize=1)
+def _iso_timestamp(bucket):
+    """ISO-8601 UTC timestamp for the epoch second ``bucket`` (see ``_now_iso``)."""
+    return datetime.utcfromtimestamp(bucket).isoformat()
+
+
+def _now_iso():
+    """Current UTC time as ISO-8601, formatted at most once per second."""
+    return _iso_timestamp(int(time.time()))
+
+
+def _json_response(payload, status=200):
+    """Return ``payload`` as an application/json response (orjson when available).
+    
+    The body is already UTF-8 bytes, so no charset is attached; WebOb sets
+    Content-Length from the body.
+    """
+    return Response(
+        body=_dumps(payload), content_type='application/json', charset=None, status=status,
+    )
+
+
+# Static demo page, read once instead of on every request
+with open(os.path.join(os.path.dirname(__file__), 'templates', 'index.html'), 'rb') as f:
+    _INDEX_HTML = f.read()
+
+
 def index_view(request):
     """Homepage with interactive demo."""
-    template_path = os.path.join(os.path.dirname(__file__), 'templates', 'index.html')
-    with open(template_path, 'r') as f:
-        html_content = f.read()
-    return Response(html_content, content_type='text/html')
+    return Response(body=_INDEX_HTML, content_type='text/html', charset='utf-8')
+
+
+# Per-process generator for the free endpoint
+_RNG = random.Random()
+
+# Free endpoint body with only the number and timestamp filled in per request
+_RANDOM_TEMPLATE = b'{"number":%d,"range":"1-6","type":"free","timestamp":"%s"}'
 
 
 def random_view(request):
     """Free random number generator (1-6)."""
-    number = random.randint(1, 6)
+    number = _RNG.randrange(1, 7)
     
-    from datetime import datetime
     return Response(
-        json.dumps({
-            'number': number,
-            'range': '1-6',
-            'type': 'free',
-            'timestamp': datetime.utcnow().isoformat(),
-        }),
-        content_type='application/json'
+        body=_RANDOM_TEMPLATE % (number, _now_iso().encode('ascii')),
+        content_type='application/json',
+        charset=None,
     )
 
 
 @require_payment(price='$0.01')
 def premium_random_view(request):
     """Premium random number generator (requires payment)."""
-    number = random.randint(1000000, 9999999)
+    # Paid output: use the OS CSPRNG so results can't be predicted from
+    # earlier responses (Mersenne Twister state is recoverable)
+    number = 1_000_000 + secrets.randbelow(9_000_000)
     
-    from datetime import datetime
-    return Response(
-        json.dumps({
-            'number': number,
-            'range': '1000000-9999999',
-            'type': 'premium',
-            'digits': 7,
-            'timestamp': datetime.utcnow().isoformat(),
-            'note': 'This number required payment!',
-        }),
-        content_type='application/json'
+    return _json_response({
+        'number': number,
+        'range': '1000000-9999999',
+        'type': 'premium',
+        'digits': 7,
+        'timestamp': _now_iso(),
+        'note': 'This number required payment!',
+    })
+
+
+# Public RPC endpoints by network
+_RPC_URLS = MappingProxyType({
+    'solana-mainnet': 'https://api.mainnet-beta.solana.com',
+    'solana-devnet': 'https://api.devnet.solana.com',
+    'solana-testnet': 'https://api.testnet.solana.com',
+})
+
+# USDC mint addresses by network
+_USDC_MINTS = MappingProxyType({
+    'solana-mainnet': 'EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v',
+    'solana-devnet': 'Gh9ZwEmdLJ8DscKNTkTqPbNwLNNBjuSzaG9Vp2KGtKJr',
+    'solana-testnet': '8zGuJQqwhZafTah7Uc7Z4tXRnguqkn5KLFAP8oV6PHe2',
+})
+
+# Parsed once so balance checks skip the base58 decode
+_USDC_MINT_PUBKEYS = MappingProxyType({
+    network: Pubkey.from_string(mint) for network, mint in _USDC_MINTS.items()
+} if SOLANA_AVAILABLE else {})
+
+
+def _derive_hot_wallet(signer_key):
+    """Public address for the base58 ``signer_key``, or None if unavailable."""
+    if not signer_key or not SOLANA_AVAILABLE:
+        return None
+    try:
+        return str(Keypair.from_bytes(base58.b58decode(signer_key)).pubkey())
+    except ValueError as e:
+        logger.warning(f"X402_SIGNER_KEY is not a valid base58 keypair: {e}")
+        return None
+
+
+# Hot wallet (server signer) address, derived once instead of per request
+_HOT_WALLET_ADDRESS = _derive_hot_wallet(_ENV.signer_key)
+
+
+@lru_cache(maxsize=512)
+def _associated_token_address(owner, mint):
+    """USDC token account for ``owner``; a deterministic PDA, so cached."""
+    return get_associated_token_address(owner, mint)
+
+
+# SPL token account layout: the u64 amount sits after the mint and owner keys
+SPL_TOKEN_ACCOUNT_SIZE = 165
+SPL_AMOUNT_OFFSET = 64
+
+
+def _token_amount(account):
+    """Raw token amount held by an SPL token account (0 if it doesn't exist)."""
+    if account is None or len(account.data) < SPL_TOKEN_ACCOUNT_SIZE:
+        return 0
+    return int.from_bytes(
+        account.data[SPL_AMOUNT_OFFSET:SPL_AMOUNT_OFFSET + 8], 'little'
     )
 
 
+_rpc_clients = {}
+_rpc_clients_lock = threading.Lock()
+
+
+def _rpc_client(rpc_url):
+    """Shared RPC client for ``rpc_url``, reusing its HTTP connection pool."""
+    client = _rpc_clients.get(rpc_url)
+    if client is None:
+        # wsgi servers call views from several threads
+        with _rpc_clients_lock:
+            client = _rpc_clients.get(rpc_url)
+            if client is None:
+                client = _rpc_clients[rpc_url] = Client(rpc_url)
+    return client
+
+
 def balances_view(request):
     """Check balances for hot wallet, cold wallet, and user wallet."""
+    if not SOLANA_AVAILABLE:
+        return _json_response({
+            'error': 'Solana libraries not installed',
+            'detail': 'Install with: pip install solana solders base58',
+        }, status=500)
+    
     try:
-        from solana.rpc.api import Client
-        from solders.pubkey import Pubkey
-        
         # Get config from registry
         settings = request.registry.settings
         network = settings.get('x402.network', 'solana-devnet')
-        rpc_urls = {
-            'solana-mainnet': 'https://api.mainnet-beta.solana.com',
-            'solana-devnet': 'https://api.devnet.solana.com',
-            'solana-testnet': 'https://api.testnet.solana.com',
-        }
-        rpc_url = rpc_urls.get(network, 'https://api.devnet.solana.com')
+        rpc_url = _RPC_URLS.get(network, _RPC_URLS['solana-devnet'])
         
-        client = Client(rpc_url)
+        client = _rpc_client(rpc_url)
         
         # Get addresses
         cold_wallet = settings.get('x402.pay_to_address', '')
-        hot_wallet = None
+        hot_wallet = _HOT_WALLET_ADDRESS
+        usdc_mint_pubkey = _USDC_MINT_PUBKEYS.get(network)
         
-        # Try to get hot wallet from signer key
-        signer_key = os.environ.get('X402_SIGNER_KEY', '')
-        if signer_key:
-            try:
-                import base58
-                from solders.keypair import Keypair
-                private_key_bytes = base58.b58decode(signer_key)
-                keypair = Keypair.from_bytes(private_key_bytes)
-                hot_wallet = str(keypair.pubkey())
-            except:
-                pass
+        user_address = request.params.get('user_address')
         
-        # USDC mint addresses
-        usdc_mints = {
-            'solana-mainnet': 'EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v',
-            'solana-devnet': 'Gh9ZwEmdLJ8DscKNTkTqPbNwLNNBjuSzaG9Vp2KGtKJr',
-            'solana-testnet': '8zGuJQqwhZafTah7Uc7Z4tXRnguqkn5KLFAP8oV6PHe2',
+        balances = {
+            'hot_wallet': {'address': 'Not configured', 'sol': 0, 'usdc': 0},
+            'cold_wallet': {'address': 'Not configured', 'sol': 0, 'usdc': 0},
+            'user_wallet': {'address': 'Not connected', 'sol': 0, 'usdc': 0},
         }
-        usdc_mint = usdc_mints.get(network)
-        
-        balances = {}
         
-        # Check hot wallet balances
+        # Wallets that actually need an RPC lookup
+        wallets = {}
         if hot_wallet and not hot_wallet.startswith('REPLACE'):
-            balances['hot_wallet'] = _get_wallet_balances(client, hot_wallet, usdc_mint)
-            balances['hot_wallet']['address'] = hot_wallet
-        else:
-            balances['hot_wallet'] = {'address': 'Not configured', 'sol': 0, 'usdc': 0}
-        
-        # Check cold wallet balances
+            wallets['hot_wallet'] = hot_wallet
         if cold_wallet and not cold_wallet.startswith('REPLACE'):
-            balances['cold_wallet'] = _get_wallet_balances(client, cold_wallet, usdc_mint)
-            balances['cold_wallet']['address'] = cold_wallet
-        else:
-            balances['cold_wallet'] = {'address': 'Not configured', 'sol': 0, 'usdc': 0}
-        
-        # Check user wallet if provided
-        user_address = request.params.get('user_address')
+            wallets['cold_wallet'] = cold_wallet
         if user_address:
-            balances['user_wallet'] = _get_wallet_balances(client, user_address, usdc_mint)
-            balances['user_wallet']['address'] = user_address
-        else:
-            balances['user_wallet'] = {'address': 'Not connected', 'sol': 0, 'usdc': 0}
+            wallets['user_wallet'] = user_address
         
-        from datetime import datetime
-        return Response(
-            json.dumps({
-                'balances': balances,
-                'network': network,
-                'rpc_url': rpc_url,
-                'timestamp': datetime.utcnow().isoformat(),
-            }),
-            content_type='application/json'
-        )
+        if wallets:
+            results = _get_wallet_balances(client, list(wallets.values()), usdc_mint_pubkey)
+            for (name, address), result in zip(wallets.items(), results):
+                balances[name] = {**result, 'address': address}
+        
+        return _json_response({
+            'balances': balances,
+            'network': network,
+            'rpc_url': rpc_url,
+            'timestamp': _now_iso(),
+        })
         
-    except ImportError:
-        return Response(
-            json.dumps({
-                'error': 'Solana libraries not installed',
-                'detail': 'Install with: pip install solana solders base58',
-            }),
-            content_type='application/json',
-            status=500
-        )
     except Exception as e:
-        return Response(
-            json.dumps({
-                'error': str(e),
-                'balances': {
-                    'hot_wallet': {'address': 'Error checking', 'sol': 0, 'usdc': 0},
-                    'cold_wallet': {'address': 'Error checking', 'sol': 0, 'usdc': 0},
-                    'user_wallet': {'address': 'Error checking', 'sol': 0, 'usdc': 0},
-                }
-            }),
-            content_type='application/json'
-        )
+        return _json_response({
+            'error': str(e),
+            'balances': {
+                'hot_wallet': {'address': 'Error checking', 'sol': 0, 'usdc': 0},
+                'cold_wallet': {'address': 'Error checking', 'sol': 0, 'usdc': 0},
+                'user_wallet': {'address': 'Error checking', 'sol': 0, 'usdc': 0},
+            }
+        })
 
 
-def _get_wallet_balances(client, address_str, usdc_mint):
-    """Get SOL and USDC balances for an address."""
-    try:
-        from solders.pubkey import Pubkey
-        from solders.token.associated import get_associated_token_address
-        
-        pubkey = Pubkey.from_string(address_str)
-        
-        # Get SOL balance
-        sol_balance = client.get_balance(pubkey).value / 1_000_000_000  # lamports to SOL
-        
-        # Get USDC balance
-        usdc_balance = 0.0
-        if usdc_mint:
-            try:
-                # Get associated token account address
-                usdc_mint_pubkey = Pubkey.from_string(usdc_mint)
-                token_account = get_associated_token_address(pubkey, usdc_mint_pubkey)
-                
-                # Get token account balance
-                token_response = client.get_token_account_balance(token_account)
-                if token_response.value:
-                    # Convert from atomic units (USDC has 6 decimals)
-                    usdc_balance = float(token_response.value.amount) / 1_000_000
-            except Exception as e:
-                # Token account might not exist yet (no USDC held)
-                logger.debug(f"No USDC account for {address_str[:8]}...: {e}")
-                usdc_balance = 0.0
+def _get_wallet_balances(client, addresses, usdc_mint_pubkey):
+    """Get SOL and USDC balances for a list of addresses.
+    
+    The wallets and their USDC token accounts are fetched in a single
+    getMultipleAccounts request instead of two RPC calls per wallet.
+    
+    Returns:
+        List of balance dicts in the same order as ``addresses``
+    """
+    results = [None] * len(addresses)
+    pubkeys = []
+    indexes = []
+    for i, address in enumerate(addresses):
+        try:
+            pubkeys.append(Pubkey.from_string(address))
+            indexes.append(i)
+        except ValueError as e:
+            results[i] = {'sol': 0, 'usdc': 0, 'error': str(e)}
+    
+    if not pubkeys:
+        return results
+    
+    token_accounts = []
+    if usdc_mint_pubkey:
+        token_accounts = [
+            _associated_token_address(pubkey, usdc_mint_pubkey) for pubkey in pubkeys
+        ]
+    
+    # Accounts come back in request order: wallets first, then token accounts
+    accounts = client.get_multiple_accounts(pubkeys + token_accounts).value
+    wallet_accounts = accounts[:len(pubkeys)]
+    usdc_accounts = accounts[len(pubkeys):] or [None] * len(pubkeys)
+    
+    for i, account, token_account in zip(indexes, wallet_accounts, usdc_accounts):
+        # Unfunded wallets and missing token accounts come back as None
+        lamports = account.lamports if account is not None else 0
+        usdc_amount = _token_amount(token_account)
         
-        return {
-            'sol': round(sol_balance, 6),
-            'usdc': round(usdc_balance, 2),
+        # Unrounded: the demo page formats with toFixed(6) / toFixed(2)
+        results[i] = {
+            'sol': lamports / 1_000_000_000,
+            'usdc': usdc_amount / 1_000_000,  # USDC has 6 decimals
         }
-    except Exception as e:
-        return {'sol': 0, 'usdc': 0, 'error': str(e)}
+    
+    return results
 
 
 # =============================================================================
@@ -223,17 +379,14 @@ def main():
     # x402 Configuration
     settings = {
         # x402 settings (prefix with 'x402.')
-        'x402.pay_to_address': os.getenv(
-            'X402_PAY_TO_ADDRESS',
-            'REPLACE_WITH_YOUR_SOLANA_ADDRESS_44_CHARS'
-        ),
-        'x402.price': os.getenv('X402_PRICE', '$0.01'),
-        'x402.network': os.getenv('X402_NETWORK', 'solana-devnet'),
+        'x402.pay_to_address': _ENV.pay_to,
+        'x402.price': _ENV.price,
+        'x402.network': _ENV.network,
         'x402.protected_paths': [],  # Use decorator instead
         'x402.description': 'Premium Random Number API',
-        'x402.debug_mode': os.getenv('X402_DEBUG_MODE', 'True').lower() == 'true',
-        'x402.rpc_url': os.getenv('X402_RPC_URL', ''),
-        'x402.use_durable_nonce': os.getenv('X402_USE_DURABLE_NONCE', 'False').lower() == 'true',
+        'x402.debug_mode': _ENV.debug_mode,
+        'x402.rpc_url': _ENV.rpc_url or '',
+        'x402.use_durable_nonce': _ENV.use_durable_nonce,
         'x402.nonce_account_env': 'X402_NONCE_ACCOUNT',
     }
     
@@ -258,34 +411,29 @@ def main():
     # Create WSGI app
     app = config.make_wsgi_app()
     
-    # Display configuration
-    print("=" * 70)
-    print("x402-connector - Solana Payment SDK (Pyramid)")
-    print("=" * 70)
-    print(f"Network:        {settings['x402.network']}")
-    print(f"Pay To:         {settings['x402.pay_to_address']}")
-    print(f"Default Price:  {settings['x402.price']}")
-    print(f"Port:           {os.getenv('PORT', '6543')}")
-    print("=" * 70)
+    port = _ENV.port
+    
+    # Log configuration
+    logger.info("\n".join([
+        "x402-connector - Solana Payment SDK (Pyramid)",
+        f"Network:        {settings['x402.network']}",
+        f"Pay To:         {settings['x402.pay_to_address']}",
+        f"Default Price:  {settings['x402.price']}",
+        f"Port:           {port}",
+    ]))
     
     # Validate configuration
     pay_to = settings['x402.pay_to_address']
     if not pay_to or len(pay_to) < 32 or pay_to.startswith('REPLACE'):
-        print("⚠️  WARNING: X402_PAY_TO_ADDRESS is not properly configured!")
-        print("   Set a valid Solana address (base58 format, 32-44 chars)")
-        print("   Set environment variable: X402_PAY_TO_ADDRESS=YourAddress")
-        print("=" * 70)
-    
-    # Start server
-    port = int(os.getenv('PORT', '6543'))
-    server = make_server('0.0.0.0', port, app)
+        logger.warning(
+            "X402_PAY_TO_ADDRESS is not properly configured! "
+            "Set a valid Solana address (base58 format, 32-44 chars)"
+        )
     
-    print(f"\n🚀 Server running at http://localhost:{port}")
-    print(f"   Demo page: http://localhost:{port}")
-    print(f"   Free API:  http://localhost:{port}/api/random")
-    print(f"   Paid API:  http://localhost:{port}/api/premium/random\n")
+    # Start server; worker threads let slow RPC balance checks overlap
+    logger.info(f"Server running at http://localhost:{port}")
     
-    server.serve_forever()
+    serve(app, host='0.0.0.0', port=port, threads=_ENV.threads)
 
 
 if __name__ == '__main__':
@@ -7,25 +7,76 @@ into a Tornado application using Solana blockchain.
 import os
 import random
 import logging
-import json
+import secrets
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional
 from tornado import web, ioloop
 from tornado.options import define, options
 from dotenv import load_dotenv
 
 from x402_connector.tornado import X402Middleware, require_payment
 
+try:
+    import base58
+    from solana.rpc.async_api import AsyncClient
+    from solders.keypair import Keypair
+    from solders.pubkey import Pubkey
+    from solders.token.associated import get_associated_token_address
+    SOLANA_AVAILABLE = True
+except ImportError:
+    SOLANA_AVAILABLE = False
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+    
+    def _dumps(payload):
+        return json.dumps(payload).encode('utf-8')
+
 # Load environment variables from .env file
 env_path = os.path.join(os.path.dirname(__file__), '.env')
 if os.path.exists(env_path):
     load_dotenv(env_path)
 
+
+@dataclass(frozen=True)
+class _Env:
+    """Environment settings, read once at import instead of per request."""
+    
+    network: str
+    pay_to: str
+    price: str
+    rpc_url: Optional[str]
+    signer_key: str
+    debug_mode: bool
+    use_durable_nonce: bool
+    tornado_debug: bool
+
+
+_ENV = _Env(
+    network=os.getenv('X402_NETWORK', 'solana-devnet'),
+    pay_to=os.getenv('X402_PAY_TO_ADDRESS', 'REPLACE_WITH_YOUR_SOLANA_ADDRESS_44_CHARS'),
+    price=os.getenv('X402_PRICE', '$0.01'),
+    rpc_url=os.getenv('X402_RPC_URL'),
+    signer_key=os.getenv('X402_SIGNER_KEY', ''),
+    debug_mode=os.getenv('X402_DEBUG_MODE', 'True').lower() == 'true',
+    use_durable_nonce=os.getenv('X402_USE_DURABLE_NONCE', 'False').lower() == 'true',
+    tornado_debug=os.getenv('TORNADO_DEBUG', 'False') == 'True',
+)
+
 # Define command line options
 define("port", default=8888, help="Port to listen on", type=int)
 define("debug", default=False, help="Run in debug mode", type=bool)
 
 # Configure logging
 logging.basicConfig(
-    level=logging.DEBUG if os.getenv('TORNADO_DEBUG', 'False') == 'True' else logging.INFO,
+    level=logging.DEBUG if _ENV.tornado_debug else logging.INFO,
     format='%(levelname)s %(asctime)s %(module)s %(message)s',
 )
 logger = logging.getLogger(__name__)
@@ -35,12 +86,44 @@ logger = logging.getLogger(__name__)
 # REQUEST HANDLERS
 # =============================================================================
 
+TEMPLATE_PATH = os.path.join(os.path.dirname(__file__), 'templates')
+
+# Static demo page, read once instead of rendered on every request
+with open(os.path.join(TEMPLATE_PATH, 'index.html'), 'rb') as f:
+    _INDEX_HTML = f.read()
+
+
+@lru_cache(maxsize=1)
+def _iso_timestamp(bucket):
+    """ISO-8601 UTC timestamp for the epoch second ``bucket`` (see ``_now_iso``)."""
+    return datetime.utcfromtimestamp(bucket).isoformat()
+
+
+def _now_iso():
+    """Current UTC time as ISO-8601, formatted at most once per second."""
+    return _iso_timestamp(int(time.time()))
+
+
+def _write_json(handler, payload):
+    """Write ``payload`` to ``handler`` as JSON (orjson when available)."""
+    handler.set_header('Content-Type', 'application/json')
+    handler.write(_dumps(payload))
+
+
 class IndexHandler(web.RequestHandler):
     """Homepage with interactive demo."""
     
     def get(self):
-        """Render the demo page."""
-        self.render('index.html')
+        """Serve the demo page."""
+        self.set_header('Content-Type', 'text/html; charset=UTF-8')
+        self.write(_INDEX_HTML)
+
+
+# Per-process generator for the free endpoint
+_RNG = random.Random()
+
+# Free endpoint body with only the number and timestamp filled in per request
+_RANDOM_TEMPLATE = b'{"number":%d,"range":"1-6","type":"free","timestamp":"%s"}'
 
 
 class RandomHandler(web.RequestHandler):
@@ -50,16 +133,10 @@ class RandomHandler(web.RequestHandler):
     
     def get(self):
         """Generate a free random number."""
-        number = random.randint(1, 6)
+        number = _RNG.randrange(1, 7)
         
-        from datetime import datetime
         self.set_header('Content-Type', 'application/json')
-        self.write(json.dumps({
-            'number': number,
-            'range': '1-6',
-            'type': 'free',
-            'timestamp': datetime.utcnow().isoformat(),
-        }))
+        self.write(_RANDOM_TEMPLATE % (number, _now_iso().encode('ascii')))
 
 
 class PremiumRandomHandler(web.RequestHandler):
@@ -68,18 +145,85 @@ class PremiumRandomHandler(web.RequestHandler):
     @require_payment(price='$0.01')
     async def get(self):
         """Generate a premium random number (requires payment)."""
-        number = random.randint(1000000, 9999999)
+        # Paid output: use the OS CSPRNG so results can't be predicted from
+        # earlier responses (Mersenne Twister state is recoverable)
+        number = 1_000_000 + secrets.randbelow(9_000_000)
         
-        from datetime import datetime
-        self.set_header('Content-Type', 'application/json')
-        self.write(json.dumps({
+        _write_json(self, {
             'number': number,
             'range': '1000000-9999999',
             'type': 'premium',
             'digits': 7,
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': _now_iso(),
             'note': 'This number required payment!',
-        }))
+        })
+
+
+# Public RPC endpoints by network
+_RPC_URLS = MappingProxyType({
+    'solana-mainnet': 'https://api.mainnet-beta.solana.com',
+    'solana-devnet': 'https://api.devnet.solana.com',
+    'solana-testnet': 'https://api.testnet.solana.com',
+})
+
+# USDC mint addresses by network
+_USDC_MINTS = MappingProxyType({
+    'solana-mainnet': 'EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v',
+    'solana-devnet': 'Gh9ZwEmdLJ8DscKNTkTqPbNwLNNBjuSzaG9Vp2KGtKJr',
+    'solana-testnet': '8zGuJQqwhZafTah7Uc7Z4tXRnguqkn5KLFAP8oV6PHe2',
+})
+
+# Parsed once so balance checks skip the base58 decode
+_USDC_MINT_PUBKEYS = MappingProxyType({
+    network: Pubkey.from_string(mint) for network, mint in _USDC_MINTS.items()
+} if SOLANA_AVAILABLE else {})
+
+
+def _derive_hot_wallet(signer_key):
+    """Public address for the base58 ``signer_key``, or None if unavailable."""
+    if not signer_key or not SOLANA_AVAILABLE:
+        return None
+    try:
+        return str(Keypair.from_bytes(base58.b58decode(signer_key)).pubkey())
+    except ValueError as e:
+        logger.warning(f"X402_SIGNER_KEY is not a valid base58 keypair: {e}")
+        return None
+
+
+# Hot wallet (server signer) address, derived once instead of per request
+_HOT_WALLET_ADDRESS = _derive_hot_wallet(_ENV.signer_key)
+
+
+@lru_cache(maxsize=512)
+def _associated_token_address(owner, mint):
+    """USDC token account for ``owner``; a deterministic PDA, so cached."""
+    return get_associated_token_address(owner, mint)
+
+
+# SPL token account layout: the u64 amount sits after the mint and owner keys
+SPL_TOKEN_ACCOUNT_SIZE = 165
+SPL_AMOUNT_OFFSET = 64
+
+
+def _token_amount(account):
+    """Raw token amount held by an SPL token account (0 if it doesn't exist)."""
+    if account is None or len(account.data) < SPL_TOKEN_ACCOUNT_SIZE:
+        return 0
+    return int.from_bytes(
+        account.data[SPL_AMOUNT_OFFSET:SPL_AMOUNT_OFFSET + 8], 'little'
+    )
+
+
+# RPC url -> AsyncClient, shared so HTTP connections stay alive
+_rpc_clients = {}
+
+
+def _rpc_client(rpc_url):
+    """Shared async RPC client for ``rpc_url``, reusing its HTTP connection pool."""
+    client = _rpc_clients.get(rpc_url)
+    if client is None:
+        client = _rpc_clients[rpc_url] = AsyncClient(rpc_url)
+    return client
 
 
 class BalancesHandler(web.RequestHandler):
@@ -89,132 +233,111 @@ class BalancesHandler(web.RequestHandler):
     
     async def get(self):
         """Get wallet balances."""
+        if not SOLANA_AVAILABLE:
+            self.set_status(500)
+            _write_json(self, {
+                'error': 'Solana libraries not installed',
+                'detail': 'Install with: pip install solana solders base58',
+            })
+            return
+        
         try:
-            from solana.rpc.api import Client
-            from solders.pubkey import Pubkey
-            
             # Get config from app settings
             network = self.application.settings.get('x402_config', {}).get('network', 'solana-devnet')
-            rpc_urls = {
-                'solana-mainnet': 'https://api.mainnet-beta.solana.com',
-                'solana-devnet': 'https://api.devnet.solana.com',
-                'solana-testnet': 'https://api.testnet.solana.com',
-            }
-            rpc_url = rpc_urls.get(network, 'https://api.devnet.solana.com')
+            rpc_url = _RPC_URLS.get(network, _RPC_URLS['solana-devnet'])
             
-            client = Client(rpc_url)
+            client = _rpc_client(rpc_url)
             
             # Get addresses
             cold_wallet = self.application.settings.get('x402_config', {}).get('pay_to_address', '')
-            hot_wallet = None
+            hot_wallet = _HOT_WALLET_ADDRESS
+            usdc_mint_pubkey = _USDC_MINT_PUBKEYS.get(network)
             
-            # Try to get hot wallet from signer key
-            signer_key = os.environ.get('X402_SIGNER_KEY', '')
-            if signer_key:
-                try:
-                    import base58
-                    from solders.keypair import Keypair
-                    private_key_bytes = base58.b58decode(signer_key)
-                    keypair = Keypair.from_bytes(private_key_bytes)
-                    hot_wallet = str(keypair.pubkey())
-                except:
-                    pass
+            user_address = self.get_argument('user_address', None)
             
-            # USDC mint addresses
-            usdc_mints = {
-                'solana-mainnet': 'EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v',
-                'solana-devnet': 'Gh9ZwEmdLJ8DscKNTkTqPbNwLNNBjuSzaG9Vp2KGtKJr',
-                'solana-testnet': '8zGuJQqwhZafTah7Uc7Z4tXRnguqkn5KLFAP8oV6PHe2',
+            balances = {
+                'hot_wallet': {'address': 'Not configured', 'sol': 0, 'usdc': 0},
+                'cold_wallet': {'address': 'Not configured', 'sol': 0, 'usdc': 0},
+                'user_wallet': {'address': 'Not connected', 'sol': 0, 'usdc': 0},
             }
-            usdc_mint = usdc_mints.get(network)
-            
-            balances = {}
             
-            # Check hot wallet balances
+            # Wallets that actually need an RPC lookup
+            wallets = {}
             if hot_wallet and not hot_wallet.startswith('REPLACE'):
-                balances['hot_wallet'] = self._get_wallet_balances(client, hot_wallet, usdc_mint)
-                balances['hot_wallet']['address'] = hot_wallet
-            else:
-                balances['hot_wallet'] = {'address': 'Not configured', 'sol': 0, 'usdc': 0}
-            
-            # Check cold wallet balances
+                wallets['hot_wallet'] = hot_wallet
             if cold_wallet and not cold_wallet.startswith('REPLACE'):
-                balances['cold_wallet'] = self._get_wallet_balances(client, cold_wallet, usdc_mint)
-                balances['cold_wallet']['address'] = cold_wallet
-            else:
-                balances['cold_wallet'] = {'address': 'Not configured', 'sol': 0, 'usdc': 0}
-            
-            # Check user wallet if provided
-            user_address = self.get_argument('user_address', None)
+                wallets['cold_wallet'] = cold_wallet
             if user_address:
-                balances['user_wallet'] = self._get_wallet_balances(client, user_address, usdc_mint)
-                balances['user_wallet']['address'] = user_address
-            else:
-                balances['user_wallet'] = {'address': 'Not connected', 'sol': 0, 'usdc': 0}
+                wallets['user_wallet'] = user_address
+            
+            if wallets:
+                results = await self._get_wallet_balances(client, list(wallets.values()), usdc_mint_pubkey)
+                for (name, address), result in zip(wallets.items(), results):
+                    balances[name] = {**result, 'address': address}
             
             # Also return RPC URL for frontend to use
-            from datetime import datetime
-            self.set_header('Content-Type', 'application/json')
-            self.write(json.dumps({
+            _write_json(self, {
                 'balances': balances,
                 'network': network,
                 'rpc_url': rpc_url,
-                'timestamp': datetime.utcnow().isoformat(),
-            }))
+                'timestamp': _now_iso(),
+            })
             
-        except ImportError:
-            self.set_status(500)
-            self.set_header('Content-Type', 'application/json')
-            self.write(json.dumps({
-                'error': 'Solana libraries not installed',
-                'detail': 'Install with: pip install solana solders base58',
-            }))
         except Exception as e:
-            self.set_header('Content-Type', 'application/json')
-            self.write(json.dumps({
+            _write_json(self, {
                 'error': str(e),
                 'balances': {
                     'hot_wallet': {'address': 'Error checking', 'sol': 0, 'usdc': 0},
                     'cold_wallet': {'address': 'Error checking', 'sol': 0, 'usdc': 0},
                     'user_wallet': {'address': 'Error checking', 'sol': 0, 'usdc': 0},
                 }
-            }))
+            })
     
-    def _get_wallet_balances(self, client, address_str, usdc_mint):
-        """Get SOL and USDC balances for an address."""
-        try:
-            from solders.pubkey import Pubkey
-            from solders.token.associated import get_associated_token_address
-            
-            pubkey = Pubkey.from_string(address_str)
-            
-            # Get SOL balance
-            sol_balance = client.get_balance(pubkey).value / 1_000_000_000  # lamports to SOL
-            
-            # Get USDC balance
-            usdc_balance = 0.0
-            if usdc_mint:
-                try:
-                    # Get associated token account address
-                    usdc_mint_pubkey = Pubkey.from_string(usdc_mint)
-                    token_account = get_associated_token_address(pubkey, usdc_mint_pubkey)
-                    
-                    # Get token account balance
-                    token_response = client.get_token_account_balance(token_account)
-                    if token_response.value:
-                        # Convert from atomic units (USDC has 6 decimals)
-                        usdc_balance = float(token_response.value.amount) / 1_000_000
-                except Exception as e:
-                    # Token account might not exist yet (no USDC held)
-                    logger.debug(f"No USDC account for {address_str[:8]}...: {e}")
-                    usdc_balance = 0.0
+    async def _get_wallet_balances(self, client, addresses, usdc_mint_pubkey):
+        """Get SOL and USDC balances for a list of addresses.
+        
+        The wallets and their USDC token accounts are fetched in a single
+        getMultipleAccounts request instead of two RPC calls per wallet.
+        
+        Returns:
+            List of balance dicts in the same order as ``addresses``
+        """
+        results = [None] * len(addresses)
+        pubkeys = []
+        indexes = []
+        for i, address in enumerate(addresses):
+            try:
+                pubkeys.append(Pubkey.from_string(address))
+                indexes.append(i)
+            except ValueError as e:
+                results[i] = {'sol': 0, 'usdc': 0, 'error': str(e)}
+        
+        if not pubkeys:
+            return results
+        
+        token_accounts = []
+        if usdc_mint_pubkey:
+            token_accounts = [
+                _associated_token_address(pubkey, usdc_mint_pubkey) for pubkey in pubkeys
+            ]
+        
+        # Accounts come back in request order: wallets first, then token accounts
+        accounts = (await client.get_multiple_accounts(pubkeys + token_accounts)).value
+        wallet_accounts = accounts[:len(pubkeys)]
+        usdc_accounts = accounts[len(pubkeys):] or [None] * len(pubkeys)
+        
+        for i, account, token_account in zip(indexes, wallet_accounts, usdc_accounts):
+            # Unfunded wallets and missing token accounts come back as None
+            lamports = account.lamports if account is not None else 0
+            usdc_amount = _token_amount(token_account)
             
-            return {
-                'sol': round(sol_balance, 6),
-                'usdc': round(usdc_balance, 2),
+            # Unrounded: the demo page formats with toFixed(6) / toFixed(2)
+            results[i] = {
+                'sol': lamports / 1_000_000_000,
+                'usdc': usdc_amount / 1_000_000,  # USDC has 6 decimals
             }
-        except Exception as e:
-            return {'sol': 0, 'usdc': 0, 'error': str(e)}
+        
+        return results
 
 
 # =============================================================================
@@ -227,16 +350,13 @@ def make_app():
     # x402 Configuration
     x402_config = {
         # Required: Your Solana address for receiving payments
-        'pay_to_address': os.getenv(
-            'X402_PAY_TO_ADDRESS',
-            'REPLACE_WITH_YOUR_SOLANA_ADDRESS_44_CHARS'  # Change this!
-        ),
+        'pay_to_address': _ENV.pay_to,
         
         # Optional: Default price
-        'price': os.getenv('X402_PRICE', '$0.01'),
+        'price': _ENV.price,
         
         # Optional: Solana network
-        'network': os.getenv('X402_NETWORK', 'solana-devnet'),
+        'network': _ENV.network,
         
         # Protected paths - empty by default, use @require_payment() decorator instead
         'protected_paths': [],
@@ -245,13 +365,13 @@ def make_app():
         'description': 'Premium Random Number API',
         
         # Debug mode (True = simulated, False = requires pre-signed transactions)
-        'debug_mode': os.getenv('X402_DEBUG_MODE', 'True').lower() == 'true',
+        'debug_mode': _ENV.debug_mode,
         
         # Optional: Custom RPC URL
-        'rpc_url': os.getenv('X402_RPC_URL'),
+        'rpc_url': _ENV.rpc_url,
         
         # Optional: Durable nonce
-        'use_durable_nonce': os.getenv('X402_USE_DURABLE_NONCE', 'False').lower() == 'true',
+        'use_durable_nonce': _ENV.use_durable_nonce,
         'nonce_account_env': 'X402_NONCE_ACCOUNT',
     }
     
@@ -263,7 +383,7 @@ def make_app():
             (r'/api/premium/random', PremiumRandomHandler),
             (r'/api/balances', BalancesHandler),
         ],
-        template_path=os.path.join(os.path.dirname(__file__), 'templates'),
+        template_path=TEMPLATE_PATH,
         static_path=os.path.join(os.path.dirname(__file__), 'static'),
         debug=options.debug,
         x402_config=x402_config,
@@ -1,11 +1,132 @@
 """Configuration management for x402 payment processing on Solana."""
 
 import os
+import sys
 from dataclasses import dataclass, field
+from functools import cache, lru_cache
+from types import MappingProxyType
 from typing import Optional, List, Dict, Any
 
 
-@dataclass
+# Supported Solana networks (tuple keeps the order for error messages)
+_NETWORKS = ('solana-mainnet', 'solana-devnet', 'solana-testnet')
+_VALID_NETWORKS = frozenset(_NETWORKS)
+
+# Public RPC endpoint per network, used when no rpc_url is configured
+_DEFAULT_RPC_URLS = MappingProxyType({
+    'solana-mainnet': 'https://api.mainnet-beta.solana.com',
+    'solana-devnet': 'https://api.devnet.solana.com',
+    'solana-testnet': 'https://api.testnet.solana.com',
+})
+
+# Modes that verify locally and need the local facilitator settings
+_LOCAL_MODES = frozenset({'local', 'hybrid'})
+
+# Default settings for the remote facilitator modes, keyed by mode
+_REMOTE_DEFAULTS = MappingProxyType({
+    'payai': MappingProxyType({
+        'facilitator_url': 'https://facilitator.payai.network',
+        'api_key_env': 'PAYAI_API_KEY',
+        'timeout': 30,
+    }),
+    'corbits': MappingProxyType({
+        'facilitator_url': 'https://api.corbits.dev',
+        'api_key_env': 'CORBITS_API_KEY',
+        'timeout': 30,
+    }),
+})
+
+# Fields that must be non-empty, checked in this order
+_REQUIRED_FIELDS = ('pay_to_address', 'price')
+
+# Variables read by X402Config.from_env, in the order they are unpacked
+_FROM_ENV_SUFFIXES = (
+    'PAY_TO_ADDRESS',
+    'PROTECTED_PATHS',
+    'PRICE',
+    'NETWORK',
+    'DESCRIPTION',
+    'RPC_URL',
+    'MAX_TIMEOUT_SECONDS',
+    'VERIFY_BALANCE',
+    'WAIT_FOR_CONFIRMATION',
+)
+
+
+# Accepted spellings for boolean environment variables
+_TRUTHY = frozenset({'true', '1', 'yes', 'on'})
+
+
+def _parse_bool(value: Optional[str], default: bool) -> bool:
+    """Parse an environment flag; unset means ``default``."""
+    if value is None:
+        return default
+    return value.strip().lower() in _TRUTHY
+
+
+def _parse_int(name: str, value: Optional[str], default: int) -> int:
+    """Parse an integer environment variable; unset means ``default``.
+    
+    Raises:
+        ValueError: If the variable is set but not an integer
+    """
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got '{value}'") from None
+
+
+@cache
+def _env_keys(prefix: str) -> tuple:
+    """Full variable names for ``_FROM_ENV_SUFFIXES``, built once per prefix."""
+    return tuple(prefix + suffix for suffix in _FROM_ENV_SUFFIXES)
+
+
+@lru_cache(maxsize=8)
+def _parse_env_values(prefix: str, values: tuple) -> MappingProxyType:
+    """Parse (and cache) ``from_env`` arguments for a ``_FROM_ENV_SUFFIXES`` snapshot.
+    
+    Only the parsed keyword arguments are cached; ``protected_paths`` is kept
+    as a tuple so the cached entry cannot be mutated through a config.
+    """
+    (pay_to, paths_str, price, network, description, rpc_url,
+     max_timeout, verify_balance, wait_for_confirmation) = values
+    
+    if not pay_to:
+        raise ValueError(
+            f"Missing required environment variable: {prefix}PAY_TO_ADDRESS"
+        )
+    
+    # Parse protected paths (usually a single path, so skip the split)
+    if paths_str is None:
+        protected_paths = ('*',)
+    elif ',' not in paths_str:
+        protected_paths = (paths_str.strip(),)
+    else:
+        protected_paths = tuple(p.strip() for p in paths_str.split(','))
+    
+    return MappingProxyType({
+        'pay_to_address': pay_to,
+        'price': '$0.01' if price is None else price,
+        'network': 'solana-mainnet' if network is None else network,
+        'protected_paths': protected_paths,
+        'description': 'API Access' if description is None else description,
+        'rpc_url': rpc_url,
+        'signer_key_env': prefix + 'SIGNER_KEY',
+        'max_timeout_seconds': _parse_int(prefix + 'MAX_TIMEOUT_SECONDS', max_timeout, 60),
+        'verify_balance': _parse_bool(verify_balance, False),
+        'wait_for_confirmation': _parse_bool(wait_for_confirmation, False),
+    })
+
+
+def clear_env_cache() -> None:
+    """Drop the environment snapshots cached by ``X402Config.from_env``."""
+    _parse_env_values.cache_clear()
+
+
+@dataclass(slots=True, eq=False)
 class X402Config:
     """Configuration for x402 payment processing on Solana.
     
@@ -64,44 +185,42 @@ class X402Config:
     
     def __post_init__(self):
         """Validate and set up configuration."""
+        # Normalized once here so lookups can compare without .lower().
+        # The mode is interned so facilitator table lookups match by identity
+        self.facilitator_mode = sys.intern(self.facilitator_mode.lower())
+        self.settle_policy = self.settle_policy.lower()
         self._validate()
         self._setup_local_config()
     
     def _validate(self):
         """Validate required fields."""
-        if not self.pay_to_address:
-            raise ValueError("pay_to_address is required")
-        
-        if not self.price:
-            raise ValueError("price is required")
+        for name in _REQUIRED_FIELDS:
+            if not getattr(self, name):
+                raise ValueError(f"{name} is required")
         
         # Validate network
-        valid_networks = ['solana-mainnet', 'solana-devnet', 'solana-testnet']
-        if self.network not in valid_networks:
+        if self.network not in _VALID_NETWORKS:
             raise ValueError(
-                f"network must be one of {valid_networks}, got '{self.network}'"
+                f"network must be one of {list(_NETWORKS)}, got '{self.network}'"
             )
         
         # Validate address format (basic check for base58)
-        if not self.pay_to_address or len(self.pay_to_address) < 32:
+        if len(self.pay_to_address) < 32:
             raise ValueError(
                 "pay_to_address must be a valid Solana address (base58 format)"
             )
     
     def _setup_local_config(self):
         """Setup facilitator configurations based on mode."""
+        mode = self.facilitator_mode
+        
         # Setup local facilitator config (used by 'local' and 'hybrid' modes)
-        if self.local is None and self.facilitator_mode in ['local', 'hybrid']:
+        if self.local is None and mode in _LOCAL_MODES:
             # Get RPC URL
             rpc_url = self.rpc_url
             if not rpc_url:
                 # Use default based on network
-                rpc_urls = {
-                    'solana-mainnet': 'https://api.mainnet-beta.solana.com',
-                    'solana-devnet': 'https://api.devnet.solana.com',
-                    'solana-testnet': 'https://api.testnet.solana.com',
-                }
-                rpc_url = rpc_urls.get(self.network, 'https://api.devnet.solana.com')
+                rpc_url = _DEFAULT_RPC_URLS.get(self.network, _DEFAULT_RPC_URLS['solana-devnet'])
             
             self.local = {
                 'private_key_env': self.signer_key_env,
@@ -113,21 +232,10 @@ class X402Config:
                 'nonce_account_env': self.nonce_account_env,
             }
         
-        # Setup PayAI facilitator config
-        if self.payai is None and self.facilitator_mode == 'payai':
-            self.payai = {
-                'facilitator_url': 'https://facilitator.payai.network',
-                'api_key_env': 'PAYAI_API_KEY',
-                'timeout': 30,
-            }
-        
-        # Setup Corbits facilitator config (future)
-        if self.corbits is None and self.facilitator_mode == 'corbits':
-            self.corbits = {
-                'facilitator_url': 'https://api.corbits.dev',
-                'api_key_env': 'CORBITS_API_KEY',
-                'timeout': 30,
-            }
+        # Setup PayAI / Corbits facilitator config (field name == mode)
+        remote_defaults = _REMOTE_DEFAULTS.get(mode)
+        if remote_defaults is not None and getattr(self, mode) is None:
+            setattr(self, mode, dict(remote_defaults))
     
     @classmethod
     def from_dict(cls, config_dict: Dict[str, Any]) -> 'X402Config':
@@ -168,31 +276,16 @@ class X402Config:
         Returns:
             X402Config instance
             
+        Parsing is cached per environment snapshot, but every call returns
+        a new instance. Changed variables are picked up automatically; call
+        ``clear_env_cache()`` to drop the cached parses.
+        
         Example:
             >>> os.environ['X402_PAY_TO_ADDRESS'] = 'DYw8j...'
             >>> config = X402Config.from_env()
         """
-        pay_to = os.getenv(f'{prefix}PAY_TO_ADDRESS')
-        if not pay_to:
-            raise ValueError(
-                f"Missing required environment variable: {prefix}PAY_TO_ADDRESS"
-            )
-        
-        # Parse protected paths
-        paths_str = os.getenv(f'{prefix}PROTECTED_PATHS', '*')
-        protected_paths = [p.strip() for p in paths_str.split(',')]
-        
-        return cls(
-            pay_to_address=pay_to,
-            price=os.getenv(f'{prefix}PRICE', '$0.01'),
-            network=os.getenv(f'{prefix}NETWORK', 'solana-mainnet'),
-            protected_paths=protected_paths,
-            description=os.getenv(f'{prefix}DESCRIPTION', 'API Access'),
-            rpc_url=os.getenv(f'{prefix}RPC_URL'),
-            signer_key_env=f'{prefix}SIGNER_KEY',
-            max_timeout_seconds=int(os.getenv(f'{prefix}MAX_TIMEOUT_SECONDS', '60')),
-            verify_balance=os.getenv(f'{prefix}VERIFY_BALANCE', 'false').lower() == 'true',
-            wait_for_confirmation=os.getenv(
-                f'{prefix}WAIT_FOR_CONFIRMATION', 'false'
-            ).lower() == 'true',
-        )
+        # os.environ is a live mapping; bind it once instead of calling getenv
+        env = os.environ
+        kwargs = dict(_parse_env_values(prefix, tuple(map(env.get, _env_keys(prefix)))))
+        kwargs['protected_paths'] = list(kwargs['protected_paths'])
+        return cls(**kwargs)
@@ -31,16 +31,16 @@ Usage:
     >>> facilitator = get_facilitator(config)
 """
 
+import importlib
 import logging
+from dataclasses import asdict, is_dataclass
 from typing import Any
 
-from .local import SolanaFacilitator
-from .payai import PayAIFacilitator
-from .corbits import CorbitsFacilitator
-from .hybrid import HybridFacilitator
-
 logger = logging.getLogger(__name__)
 
+# Misconfiguration warnings already logged (see _warn_once)
+_warned = set()
+
 __all__ = [
     'SolanaFacilitator',
     'PayAIFacilitator',
@@ -49,6 +49,22 @@ __all__ = [
     'get_facilitator',
 ]
 
+# Facilitator classes are imported on first use so that, e.g., local mode
+# never imports the HTTP client the remote facilitators need
+_LAZY_CLASSES = {
+    'SolanaFacilitator': '.local',
+    'PayAIFacilitator': '.payai',
+    'CorbitsFacilitator': '.corbits',
+    'HybridFacilitator': '.hybrid',
+}
+
+
+def __getattr__(name):
+    module = _LAZY_CLASSES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
+
 
 def get_facilitator(config):
     """Factory function to create appropriate facilitator based on configuration.
@@ -111,69 +127,90 @@ def get_facilitator(config):
         >>> facilitator = get_facilitator(config)
         >>> # Returns: HybridFacilitator (verify=local, settle=payai)
     """
-    mode = getattr(config, 'facilitator_mode', 'local').lower()
+    # X402Config lowercases facilitator_mode on construction
+    mode = getattr(config, 'facilitator_mode', 'local')
     
     logger.info(f"Creating facilitator: mode={mode}")
     
-    if mode == 'local':
-        # Self-hosted mode (default)
-        local_cfg = getattr(config, 'local', None)
-        local_dict = local_cfg.__dict__ if hasattr(local_cfg, '__dict__') else (local_cfg or {})
-        logger.info("✅ Using LOCAL facilitator (self-hosted)")
-        return SolanaFacilitator(config=local_dict)
-    
-    elif mode == 'payai':
-        # PayAI managed service
-        payai_cfg = getattr(config, 'payai', None)
-        payai_dict = payai_cfg.__dict__ if hasattr(payai_cfg, '__dict__') else (payai_cfg or {})
-        logger.info("✅ Using PAYAI facilitator (https://payai.network)")
-        return PayAIFacilitator(config=payai_dict)
-    
-    elif mode == 'corbits':
-        # Corbits managed service
-        corbits_cfg = getattr(config, 'corbits', None)
-        corbits_dict = corbits_cfg.__dict__ if hasattr(corbits_cfg, '__dict__') else (corbits_cfg or {})
-        logger.info("✅ Using CORBITS facilitator (https://corbits.dev)")
-        return CorbitsFacilitator(config=corbits_dict)
-    
-    elif mode == 'hybrid':
-        # Hybrid mode: local verification + remote settlement
-        hybrid_config = {
-            'verify_mode': 'local',
-            'settle_mode': getattr(config, 'hybrid_settle_mode', 'payai'),  # Default to PayAI
-            'local': None,
-            'payai': None,
-            'corbits': None,
-        }
-        
-        # Get local config
-        local_cfg = getattr(config, 'local', None)
-        if local_cfg:
-            hybrid_config['local'] = local_cfg.__dict__ if hasattr(local_cfg, '__dict__') else local_cfg
-        
-        # Get PayAI config
-        payai_cfg = getattr(config, 'payai', None)
-        if payai_cfg:
-            hybrid_config['payai'] = payai_cfg.__dict__ if hasattr(payai_cfg, '__dict__') else payai_cfg
-        
-        # Get Corbits config
-        corbits_cfg = getattr(config, 'corbits', None)
-        if corbits_cfg:
-            hybrid_config['corbits'] = corbits_cfg.__dict__ if hasattr(corbits_cfg, '__dict__') else corbits_cfg
-        
-        # Determine settlement mode based on what's configured
-        if hybrid_config['corbits'] and not hybrid_config['payai']:
-            hybrid_config['settle_mode'] = 'corbits'
-        elif not hybrid_config['payai'] and not hybrid_config['corbits']:
-            logger.warning("⚠️  Hybrid mode requires PayAI or Corbits config for settlement")
-        
-        logger.info(f"✅ Using HYBRID facilitator (verify=local, settle={hybrid_config['settle_mode']})")
-        return HybridFacilitator(config=hybrid_config)
-    
-    else:
-        # Unknown mode
+    factory = _FACTORIES.get(mode)
+    if factory is None:
         raise ValueError(
             f"Unsupported facilitator_mode: '{mode}'. "
             f"Must be one of: 'local', 'payai', 'corbits', 'hybrid'"
         )
+    return factory(config)
+
+
+def _warn_once(message):
+    """Log ``message`` as a warning the first time it is seen.
+    
+    Every derived processor (e.g. one per route with a price override) builds
+    its own facilitator, so the same misconfiguration would otherwise be
+    logged once per derived config instead of once per process.
+    """
+    if message not in _warned:
+        _warned.add(message)
+        logger.warning(message)
+
+
+def _cfg_to_dict(cfg):
+    """Nested facilitator settings as a dict (accepts dicts or config objects)."""
+    if isinstance(cfg, dict):
+        return cfg
+    if cfg is None:
+        return {}
+    # asdict also handles slotted dataclasses, which have no __dict__
+    if is_dataclass(cfg):
+        return asdict(cfg)
+    return vars(cfg)
+
+
+def _make_local(config):
+    """Self-hosted verification and settlement (default)."""
+    from .local import SolanaFacilitator
+    logger.info("✅ Using LOCAL facilitator (self-hosted)")
+    return SolanaFacilitator(config=_cfg_to_dict(getattr(config, 'local', None)))
+
+
+def _make_payai(config):
+    """PayAI managed service."""
+    from .payai import PayAIFacilitator
+    logger.info("✅ Using PAYAI facilitator (https://payai.network)")
+    return PayAIFacilitator(config=_cfg_to_dict(getattr(config, 'payai', None)))
+
+
+def _make_corbits(config):
+    """Corbits managed service."""
+    from .corbits import CorbitsFacilitator
+    logger.info("✅ Using CORBITS facilitator (https://corbits.dev)")
+    return CorbitsFacilitator(config=_cfg_to_dict(getattr(config, 'corbits', None)))
+
+
+def _make_hybrid(config):
+    """Local verification + remote settlement."""
+    from .hybrid import HybridFacilitator
+    hybrid_config = {
+        'verify_mode': 'local',
+        'settle_mode': getattr(config, 'hybrid_settle_mode', 'payai'),  # Default to PayAI
+        'local': _cfg_to_dict(getattr(config, 'local', None)) or None,
+        'payai': _cfg_to_dict(getattr(config, 'payai', None)) or None,
+        'corbits': _cfg_to_dict(getattr(config, 'corbits', None)) or None,
+    }
+    
+    # Determine settlement mode based on what's configured
+    if hybrid_config['corbits'] and not hybrid_config['payai']:
+        hybrid_config['settle_mode'] = 'corbits'
+    elif not hybrid_config['payai'] and not hybrid_config['corbits']:
+        _warn_once("⚠️  Hybrid mode requires PayAI or Corbits config for settlement")
+    
+    logger.info(f"✅ Using HYBRID facilitator (verify=local, settle={hybrid_config['settle_mode']})")
+    return HybridFacilitator(config=hybrid_config)
+
 
+# facilitator_mode -> factory
+_FACTORIES = {
+    'local': _make_local,
+    'payai': _make_payai,
+    'corbits': _make_corbits,
+    'hybrid': _make_hybrid,
+}
@@ -18,6 +18,15 @@ import logging
 import requests
 from typing import Any, Dict, Optional
 
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+    
+    def _dumps(payload):
+        return json.dumps(payload).encode('utf-8')
+
 logger = logging.getLogger(__name__)
 
 
@@ -67,8 +76,22 @@ class CorbitsFacilitator:
         
         self.timeout = self.config.get('timeout', 30)
         
+        # One session per facilitator so connections are kept alive
+        self._session = requests.Session()
+        self._session.headers.update(self._get_headers())
+        
         logger.info(f"Corbits facilitator initialized: {self.facilitator_url}")
     
+    def close(self) -> None:
+        """Close pooled HTTP connections to the Corbits facilitator."""
+        self._session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
     def _get_headers(self) -> Dict[str, str]:
         """Get HTTP headers for Corbits API requests.
         
@@ -108,10 +131,9 @@ class CorbitsFacilitator:
             
             logger.debug(f"Verifying payment with Corbits: {verify_url}")
             
-            response = requests.post(
+            response = self._session.post(
                 verify_url,
-                json=payload,
-                headers=self._get_headers(),
+                data=_dumps(payload),
                 timeout=self.timeout
             )
             
@@ -182,10 +204,9 @@ class CorbitsFacilitator:
             
             logger.info(f"Settling payment with Corbits: {settle_url}")
             
-            response = requests.post(
+            response = self._session.post(
                 settle_url,
-                json=payload,
-                headers=self._get_headers(),
+                data=_dumps(payload),
                 timeout=self.timeout
             )
             
@@ -257,9 +278,8 @@ class CorbitsFacilitator:
         try:
             nonce_url = f"{self.facilitator_url}/v1/nonce"
             
-            response = requests.get(
+            response = self._session.get(
                 nonce_url,
-                headers=self._get_headers(),
                 timeout=self.timeout
             )
             
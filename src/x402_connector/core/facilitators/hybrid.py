@@ -42,6 +42,9 @@ class HybridFacilitator:
                 'private_key_env': 'X402_SIGNER_KEY',  # Not needed for verify-only
                 'rpc_url': 'https://api.mainnet-beta.solana.com',
                 'verify_balance': False,
+                # Optional: networks to verify locally; others go to the
+                # remote facilitator. Default: verify every network locally
+                'supported_networks': ['solana-mainnet'],
             },
             'payai': {
                 # PayAI facilitator config (for settlement)
@@ -88,8 +91,11 @@ class HybridFacilitator:
         
         # Initialize verifier (currently only local supported)
         if self.verify_mode == 'local':
-            local_config = self.config.get('local', {})
+            local_config = self.config.get('local') or {}
             self.verifier = SolanaFacilitator(config=local_config)
+            self._local_networks = frozenset(
+                network.lower() for network in local_config.get('supported_networks', ())
+            )
         else:
             raise ValueError(f"Unsupported verify_mode: {self.verify_mode}")
         
@@ -112,6 +118,8 @@ class HybridFacilitator:
         """Verify payment locally (fast, no external calls).
         
         Uses local Solana facilitator for verification without external API calls.
+        If ``supported_networks`` is configured, payments on other networks
+        skip local verification and are verified by the remote facilitator.
         
         Args:
             payment: Payment payload from X-PAYMENT header
@@ -120,6 +128,11 @@ class HybridFacilitator:
         Returns:
             {'isValid': True/False, 'invalidReason': str, 'payer': str}
         """
+        network = str(payment.get('network', '')).lower()
+        if self._local_networks and network not in self._local_networks:
+            logger.debug(f"Hybrid: {network} not verified locally, using {self.settle_mode}")
+            return self.settler.verify(payment, requirements)
+        
         logger.debug("Hybrid: verifying payment locally")
         result = self.verifier.verify(payment, requirements)
         
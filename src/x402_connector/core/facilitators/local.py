@@ -7,13 +7,134 @@ Supports both regular blockhashes and durable transaction nonces.
 """
 
 import os
+import math
 import time
 import base64
+import hashlib
 import logging
-from typing import Any, Dict, Optional, Set
+import threading
+from collections import deque
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+try:
+    import base58
+    from solana.rpc.api import Client
+    from solana.rpc.types import TxOpts
+    from solders.keypair import Keypair
+    from solders.pubkey import Pubkey
+    from solders.signature import Signature
+    from solders.transaction import Transaction
+    SOLANA_AVAILABLE = True
+except ImportError:
+    SOLANA_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_RPC_URL = 'https://api.devnet.solana.com'
+
+
+@lru_cache(maxsize=1024)
+def _parse_pubkey(address: str):
+    """Parse a base58 address, caching results for repeat payers."""
+    return Pubkey.from_string(address)
+
+
+# Replay cache sizing: nonces remembered and acceptable false-positive rate
+NONCE_WINDOW = 100_000
+NONCE_ERROR_RATE = 1e-6
+RECENT_NONCES = 1024
+
+# Seconds to reuse durable nonce info between 402 responses (0 = no caching)
+NONCE_INFO_TTL = 0.0
+
+
+class _NonceBloom:
+    """Bounded replay cache for payment nonces.
+    
+    Nonces of authorizations with a ``validBefore`` go into two Bloom
+    filters used in turn. Once the active one has seen half the window it
+    becomes the stale one, but only after every nonce in the old stale
+    filter has expired, since a nonce is only replayable while its payment
+    is still valid. Until then the active filter keeps filling (its
+    false-positive rate rises, but nothing is forgotten). The filters are
+    allocated on first use, so facilitators that never verify cost nothing.
+    
+    Nonces of authorizations without a ``validBefore`` never expire, so they
+    are kept in an exact set forever, as are the last ``recent`` nonces,
+    which are checked first so replays of recent payments never depend on
+    the filter.
+    """
+    
+    def __init__(
+        self,
+        capacity: int = NONCE_WINDOW,
+        error_rate: float = NONCE_ERROR_RATE,
+        recent: int = RECENT_NONCES,
+    ):
+        bits_per_key = math.log2(1 / error_rate)
+        self._k = max(1, math.ceil(bits_per_key))
+        self._nbytes = max(1, math.ceil(1.44 * bits_per_key * capacity / 8))
+        self._m = self._nbytes * 8
+        self._rotate_at = max(1, capacity // 2)
+        self._active = None
+        self._stale = None
+        # Latest validBefore inserted into each filter
+        self._active_expiry = 0
+        self._stale_expiry = 0
+        self._count = 0
+        self._forever = set()
+        self._recent = deque(maxlen=recent)
+        self._recent_set = set()
+    
+    def _indexes(self, key: bytes):
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:4], 'little')
+        h2 = int.from_bytes(digest[4:8], 'little') | 1
+        m = self._m
+        return [(h1 + i * h2) % m for i in range(self._k)]
+    
+    def __contains__(self, key: bytes) -> bool:
+        if key in self._recent_set or key in self._forever:
+            return True
+        active, stale = self._active, self._stale
+        if active is None:
+            return False
+        in_active = in_stale = True
+        for index in self._indexes(key):
+            byte, bit = index >> 3, 1 << (index & 7)
+            in_active = in_active and bool(active[byte] & bit)
+            in_stale = in_stale and bool(stale[byte] & bit)
+            if not (in_active or in_stale):
+                return False
+        return True
+    
+    def add(self, key: bytes, valid_before: int, now: int) -> None:
+        """Remember ``key`` until ``valid_before`` (0 = forever) has passed."""
+        if len(self._recent) == self._recent.maxlen:
+            self._recent_set.discard(self._recent[0])
+        self._recent.append(key)
+        self._recent_set.add(key)
+        
+        if not valid_before:
+            self._forever.add(key)
+            return
+        
+        if self._active is None:
+            self._active = bytearray(self._nbytes)
+            self._stale = bytearray(self._nbytes)
+        elif self._count >= self._rotate_at and self._stale_expiry < now:
+            self._active, self._stale = bytearray(self._nbytes), self._active
+            self._stale_expiry, self._active_expiry = self._active_expiry, 0
+            self._count = 0
+        
+        active = self._active
+        for index in self._indexes(key):
+            active[index >> 3] |= 1 << (index & 7)
+        self._count += 1
+        if valid_before > self._active_expiry:
+            self._active_expiry = valid_before
+
 
 class SolanaFacilitator:
     """Solana facilitator for payment processing.
@@ -33,6 +154,7 @@ class SolanaFacilitator:
             'wait_for_confirmation': False,
             'use_durable_nonce': False,  # Set True to use durable nonces
             'nonce_account_env': 'X402_NONCE_ACCOUNT',  # Env var with nonce account address
+            'nonce_info_ttl': 0,  # Seconds to cache nonce info (single instance only)
         }
     """
     
@@ -43,9 +165,14 @@ class SolanaFacilitator:
             config: Configuration dictionary
         """
         self.config = config or {}
-        self._used_nonces: Set[str] = set()
+        self._used_nonces = _NonceBloom()
         self._durable_nonce_account = None
         self._durable_nonce_value = None
+        self._clients: Dict[str, Any] = {}
+        self._clients_lock = threading.Lock()
+        self._signer = None
+        self._signer_key = None
+        self._nonce_info_cache = (0.0, None)
         
         # Initialize durable nonce if enabled
         if self.config.get('use_durable_nonce'):
@@ -76,21 +203,48 @@ class SolanaFacilitator:
     def get_durable_nonce_info(self) -> Optional[Dict[str, Any]]:
         """Get durable nonce information for 402 response.
         
+        Set ``nonce_info_ttl`` to reuse the result for that many seconds
+        instead of reading the account on every 402 response. The cache is
+        only dropped when *this* facilitator broadcasts, so it is only safe
+        when a single facilitator instance settles with the nonce account.
+        Other instances (per-route processors, other workers) would keep
+        handing out an already-advanced nonce until the TTL expires. Off by
+        default.
+        
         Returns:
             Dict with nonce account and current nonce value, or None
         """
         if not self._durable_nonce_account:
             return None
         
+        ttl = float(self.config.get('nonce_info_ttl', NONCE_INFO_TTL))
+        if ttl <= 0:
+            return self._fetch_durable_nonce_info()
+        
+        expires_at, info = self._nonce_info_cache
+        if info is not None and time.monotonic() < expires_at:
+            return info
+        
+        info = self._fetch_durable_nonce_info()
+        if info is not None:
+            self._nonce_info_cache = (time.monotonic() + ttl, info)
+        return info
+    
+    def _fetch_durable_nonce_info(self) -> Optional[Dict[str, Any]]:
+        """Read the durable nonce account from the RPC node.
+        
+        Returns:
+            Dict with nonce account and current nonce value, or None
+        """
         try:
             # Get RPC connection
             rpc_url_env = str(self.config.get('rpc_url_env', 'X402_RPC_URL'))
-            rpc_url = self.config.get('rpc_url') or os.environ.get(rpc_url_env, 'https://api.devnet.solana.com')
+            rpc_url = self.config.get('rpc_url') or os.environ.get(rpc_url_env, DEFAULT_RPC_URL)
             
-            from solana.rpc.api import Client
-            from solders.pubkey import Pubkey
+            if not SOLANA_AVAILABLE:
+                raise ImportError('Solana libraries not installed')
             
-            client = Client(rpc_url)
+            client = self._get_client(rpc_url)
             nonce_pubkey = Pubkey.from_string(self._durable_nonce_account)
             
             # Get current nonce value
@@ -165,7 +319,7 @@ class SolanaFacilitator:
             from_addr = str(auth.get('from', ''))
             to_addr = str(auth.get('to', ''))
             value = str(auth.get('value', ''))
-            now = int(time.time())
+            now = time.time_ns() // 1_000_000_000
             valid_after = int(str(auth.get('validAfter', '0')) or 0)
             valid_before = int(str(auth.get('validBefore', '0')) or 0)
             nonce = auth.get('nonce')
@@ -198,37 +352,27 @@ class SolanaFacilitator:
                 }
             
             # Step 6: Check nonce not used (replay protection)
-            nonce_str = str(nonce) if nonce else ''
-            if nonce_str in self._used_nonces:
+            nonce_bytes = str(nonce).encode('utf-8') if nonce else b''
+            if nonce_bytes and nonce_bytes in self._used_nonces:
                 return {'isValid': False, 'invalidReason': 'nonce_already_used'}
             
             # Step 7: Verify Ed25519 signature (if signature provided)
-            if signature and from_addr:
+            if signature and from_addr and not SOLANA_AVAILABLE:
+                logger.warning("Solana libraries not available, skipping signature verification")
+            elif signature and from_addr:
                 try:
-                    # Try to import Solana libraries
-                    from solders.keypair import Keypair
-                    from solders.pubkey import Pubkey
-                    from solders.signature import Signature
-                    
-                    # Build message to verify
-                    # Format: from|to|value|validAfter|validBefore|nonce
-                    message = f"{from_addr}|{to_addr}|{value}|{valid_after}|{valid_before}|{nonce}"
-                    message_bytes = message.encode('utf-8')
-                    
-                    # Parse signature
+                    # WARNING: the signature is NOT verified here. This is
+                    # simplified for demonstration: we only check that the
+                    # signature and public key are well-formed. In real mode the
+                    # cluster checks the pre-signed transaction when it is
+                    # broadcast, but with debug_mode (the X402Config default)
+                    # nothing is broadcast, so any well-formed signature passes.
                     sig_bytes = base64.b64decode(signature) if not signature.startswith('0x') else bytes.fromhex(signature[2:])
-                    sig = Signature.from_bytes(sig_bytes)
-                    
-                    # Parse public key
-                    pubkey = Pubkey.from_string(from_addr)
+                    Signature.from_bytes(sig_bytes)
+                    _parse_pubkey(from_addr)
                     
-                    # Verify signature
-                    # Note: In real implementation, we'd verify the signature properly
-                    # This is simplified for demonstration
                     logger.info(f"Solana signature verification for {from_addr}")
                     
-                except ImportError:
-                    logger.warning("Solana libraries not available, skipping signature verification")
                 except Exception as e:
                     logger.warning(f"Solana signature verification failed: {e}")
                     return {
@@ -247,8 +391,8 @@ class SolanaFacilitator:
                     return {'isValid': False, 'invalidReason': 'insufficient_balance'}
             
             # All checks passed - mark nonce as used
-            if nonce_str:
-                self._used_nonces.add(nonce_str)
+            if nonce_bytes:
+                self._used_nonces.add(nonce_bytes, valid_before, now)
             
             logger.info(f"Solana payment verified from {from_addr}")
             return {'isValid': True, 'payer': from_addr}
@@ -303,36 +447,30 @@ class SolanaFacilitator:
                 elif 'testnet' in os.environ.get('X402_NETWORK', '').lower():
                     rpc_url = 'https://api.testnet.solana.com'
                 else:
-                    rpc_url = 'https://api.devnet.solana.com'
+                    rpc_url = DEFAULT_RPC_URL
                 logger.info(f"Using default Solana RPC: {rpc_url}")
             else:
                 logger.info(f"Using RPC from {rpc_url_env}: {rpc_url}")
             
             # Initialize Solana client
-            try:
-                from solana.rpc.api import Client
-                from solders.keypair import Keypair
-                from solders.pubkey import Pubkey
-                from solders.transaction import Transaction
-                import base58
-            except ImportError:
+            if not SOLANA_AVAILABLE:
                 return {
                     'success': False,
                     'error': 'Solana libraries not installed. Install with: pip install -e ".[solana]"'
                 }
             
             # Connect to Solana
-            client = Client(rpc_url)
+            client = self._get_client(rpc_url)
             
             # Load keypair from private key
             try:
-                private_key_bytes = base58.b58decode(private_key_b58)
-                signer = Keypair.from_bytes(private_key_bytes)
+                signer = self._get_signer(private_key_b58)
             except Exception as e:
                 return {'success': False, 'error': f'Invalid private key: {e}'}
             
             # Extract payment data
-            auth = payment.get('payload', {}).get('authorization', {})
+            payload = payment.get('payload', {})
+            auth = payload.get('authorization', {})
             from_addr = auth.get('from')
             to_addr = auth.get('to')
             value = int(str(auth.get('value', '0')) or 0)
@@ -364,11 +502,8 @@ class SolanaFacilitator:
             
             # REAL MODE: Broadcast pre-signed transaction from user
             try:
-                # Extract payload from payment
-                payload_data = payment.get('payload', {})
-                
                 # Check if user provided pre-signed transaction
-                signed_tx = payload_data.get('signedTransaction')
+                signed_tx = payload.get('signedTransaction')
                 
                 if not signed_tx:
                     logger.warning("⚠️  User did not provide pre-signed transaction")
@@ -394,9 +529,6 @@ class SolanaFacilitator:
                     # The user has already signed the transaction (partial signature)
                     # Now we add the server's signature for the nonce advance instruction
                     try:
-                        from solders.signature import Signature
-                        from solders.message import Message
-                        
                         # Extract the message and existing signatures
                         message = transaction.message
                         user_signatures = list(transaction.signatures)
@@ -444,8 +576,6 @@ class SolanaFacilitator:
                 
                 # Try to send the transaction
                 try:
-                    from solana.rpc.types import TxOpts
-                    
                     response = client.send_raw_transaction(
                         tx_bytes,
                         opts=TxOpts(skip_preflight=False, max_retries=3)
@@ -472,6 +602,9 @@ class SolanaFacilitator:
                     # Other errors
                     logger.error(f"❌ Transaction broadcast failed: {error_str}")
                     raise
+                finally:
+                    # Broadcasting advances the durable nonce; refetch it
+                    self._nonce_info_cache = (0.0, None)
                 
                 # Wait for confirmation if enabled
                 if wait_for_confirmation:
@@ -498,6 +631,37 @@ class SolanaFacilitator:
             logger.error(f"Solana settlement error: {exc}", exc_info=True)
             return {'success': False, 'error': str(exc)}
     
+    def _get_client(self, rpc_url: str):
+        """Get the RPC client for ``rpc_url``, reusing its HTTP connection.
+        
+        Args:
+            rpc_url: Solana RPC endpoint
+            
+        Returns:
+            solana.rpc.api.Client shared by all calls on this facilitator
+        """
+        client = self._clients.get(rpc_url)
+        if client is None:
+            with self._clients_lock:
+                client = self._clients.get(rpc_url)
+                if client is None:
+                    client = self._clients[rpc_url] = Client(rpc_url)
+        return client
+    
+    def _get_signer(self, private_key_b58: str):
+        """Get the server keypair, decoding it only when the key changes.
+        
+        Args:
+            private_key_b58: Base58-encoded private key
+            
+        Returns:
+            solders.keypair.Keypair
+        """
+        if private_key_b58 != self._signer_key:
+            self._signer = Keypair.from_bytes(base58.b58decode(private_key_b58))
+            self._signer_key = private_key_b58
+        return self._signer
+    
     def _should_check_balance(self) -> bool:
         """Check if balance verification is enabled."""
         return bool(self.config.get('verify_balance', False))
@@ -519,13 +683,13 @@ class SolanaFacilitator:
             Dict with 'sufficient', 'balance', 'required', 'checked'
         """
         try:
-            from solana.rpc.api import Client
-            from solders.pubkey import Pubkey
+            if not SOLANA_AVAILABLE:
+                raise ImportError('Solana libraries not installed')
             
             rpc_url_env = str(self.config.get('rpc_url_env', 'X402_RPC_URL'))
-            rpc_url = os.environ.get(rpc_url_env, 'https://api.devnet.solana.com')
+            rpc_url = os.environ.get(rpc_url_env, DEFAULT_RPC_URL)
             
-            client = Client(rpc_url)
+            client = self._get_client(rpc_url)
             
             # Get token account for this address
             # This is simplified - real implementation would use
@@ -17,6 +17,15 @@ import logging
 import requests
 from typing import Any, Dict, Optional
 
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+    
+    def _dumps(payload):
+        return json.dumps(payload).encode('utf-8')
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,8 +69,22 @@ class PayAIFacilitator:
         
         self.timeout = self.config.get('timeout', 30)
         
+        # One session per facilitator so connections are kept alive
+        self._session = requests.Session()
+        self._session.headers.update(self._get_headers())
+        
         logger.info(f"PayAI facilitator initialized: {self.facilitator_url}")
     
+    def close(self) -> None:
+        """Close pooled HTTP connections to the PayAI facilitator."""
+        self._session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
     def _get_headers(self) -> Dict[str, str]:
         """Get HTTP headers for PayAI API requests.
         
@@ -101,10 +124,9 @@ class PayAIFacilitator:
             
             logger.debug(f"Verifying payment with PayAI: {verify_url}")
             
-            response = requests.post(
+            response = self._session.post(
                 verify_url,
-                json=payload,
-                headers=self._get_headers(),
+                data=_dumps(payload),
                 timeout=self.timeout
             )
             
@@ -162,10 +184,9 @@ class PayAIFacilitator:
             
             logger.info(f"Settling payment with PayAI: {settle_url}")
             
-            response = requests.post(
+            response = self._session.post(
                 settle_url,
-                json=payload,
-                headers=self._get_headers(),
+                data=_dumps(payload),
                 timeout=self.timeout
             )
             
@@ -223,9 +244,8 @@ class PayAIFacilitator:
         try:
             nonce_url = f"{self.facilitator_url}/nonce"
             
-            response = requests.get(
+            response = self._session.get(
                 nonce_url,
-                headers=self._get_headers(),
                 timeout=self.timeout
             )
             
@@ -3,6 +3,8 @@
 import base64
 import json
 import logging
+import re
+from types import MappingProxyType
 from typing import List, Optional, Dict, Any
 
 from .config import X402Config
@@ -10,6 +12,13 @@ from .context import RequestContext, ProcessingResult, SettlementResult
 
 logger = logging.getLogger(__name__)
 
+# Solana USDC mint addresses by network
+_USDC_MINTS = MappingProxyType({
+    'solana-mainnet': 'EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v',
+    'solana-devnet': 'Gh9ZwEmdLJ8DscKNTkTqPbNwLNNBjuSzaG9Vp2KGtKJr',
+    'solana-testnet': '8zGuJQqwhZafTah7Uc7Z4tXRnguqkn5KLFAP8oV6PHe2',
+})
+
 
 class X402PaymentProcessor:
     """Framework-agnostic x402 payment processing engine.
@@ -66,6 +75,7 @@ class X402PaymentProcessor:
             self.facilitator = facilitator
         
         self._payment_cache: Dict[str, SettlementResult] = {}
+        self._protected_re = self._compile_protected_paths(config.protected_paths)
     
     def process_request(self, context: RequestContext) -> ProcessingResult:
         """Process incoming request for payment verification.
@@ -221,10 +231,38 @@ class X402PaymentProcessor:
             logger.error(f"Settlement error: {e}", exc_info=True)
             return SettlementResult(success=False, error=str(e))
     
+    @staticmethod
+    def _compile_protected_paths(patterns: List[str]) -> re.Pattern[str]:
+        """Compile protected path patterns into a single regex.
+        
+        '*' matches every path, 'prefix/*' matches paths starting with
+        'prefix', and any other pattern must match the path exactly.
+        
+        Args:
+            patterns: Protected path patterns from the config
+            
+        Returns:
+            Compiled pattern to be used with ``match()``
+        """
+        alternatives = []
+        for pattern in patterns:
+            if pattern == '*':
+                alternatives.append('')
+            elif pattern.endswith('/*'):
+                alternatives.append(re.escape(pattern[:-2]))
+            else:
+                alternatives.append(re.escape(pattern) + r'\Z')
+        
+        if not alternatives:
+            # Never matches
+            return re.compile(r'(?!)')
+        return re.compile('|'.join(alternatives))
+    
     def _is_protected_path(self, path: str) -> bool:
         """Check if path matches protected patterns.
         
-        Supports glob patterns like '/api/premium/*'.
+        Supports glob patterns like '/api/premium/*'. The patterns are
+        compiled once when the processor is created.
         
         Args:
             path: Request path
@@ -232,23 +270,7 @@ class X402PaymentProcessor:
         Returns:
             True if path requires payment
         """
-        # Simple implementation - full version would use x402.path.path_is_match
-        protected = self.config.protected_paths
-        
-        # Special case: '*' matches everything
-        if '*' in protected:
-            return True
-        
-        # Check each pattern
-        for pattern in protected:
-            if pattern.endswith('/*'):
-                prefix = pattern[:-2]
-                if path.startswith(prefix):
-                    return True
-            elif pattern == path:
-                return True
-        
-        return False
+        return self._protected_re.match(path) is not None
     
     def _build_payment_requirements(
         self, 
@@ -267,14 +289,7 @@ class X402PaymentProcessor:
         # Convert price to atomic units for Solana USDC (6 decimals)
         max_amount = self._price_to_atomic_units(self.config.price)
         
-        # Solana USDC mint addresses by network
-        usdc_mints = {
-            'solana-mainnet': 'EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v',
-            'solana-devnet': 'Gh9ZwEmdLJ8DscKNTkTqPbNwLNNBjuSzaG9Vp2KGtKJr',
-            'solana-testnet': '8zGuJQqwhZafTah7Uc7Z4tXRnguqkn5KLFAP8oV6PHe2',
-        }
-        
-        asset = usdc_mints.get(self.config.network, usdc_mints['solana-devnet'])
+        asset = _USDC_MINTS.get(self.config.network, _USDC_MINTS['solana-devnet'])
         
         # Get durable nonce info from facilitator (if available)
         nonce_info = None
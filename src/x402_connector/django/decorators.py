@@ -1,6 +1,8 @@
 """Decorators for protecting Django views with x402 payments."""
 
 import logging
+import weakref
+from dataclasses import replace
 from functools import wraps
 from typing import Optional, Callable
 from django.http import HttpRequest, HttpResponse
@@ -53,6 +55,10 @@ def require_payment(price: Optional[str] = None, description: Optional[str] = No
         ...     return JsonResponse({'data': 'content'})
     """
     def decorator(view_func: Callable) -> Callable:
+        # Processors with this route's price/description, derived once per
+        # base processor rather than rebuilt (with a new facilitator) per request
+        derived_processors = weakref.WeakKeyDictionary()
+        
         @wraps(view_func)
         def wrapper(request: HttpRequest, *args, **kwargs) -> HttpResponse:
             if _processor is None:
@@ -68,20 +74,18 @@ def require_payment(price: Optional[str] = None, description: Optional[str] = No
             
             # Override price/description if specified
             if price is not None or description is not None:
-                # Create a modified copy of the config using dataclasses.replace
-                from dataclasses import replace
-                from ..core.processor import X402PaymentProcessor
-                
-                config_kwargs = {}
-                if price is not None:
-                    config_kwargs['price'] = price
-                if description is not None:
-                    config_kwargs['description'] = description
-                
-                config = replace(_processor.config, **config_kwargs)
-                
-                # Create temporary processor with modified config
-                processor = X402PaymentProcessor(config)
+                processor = derived_processors.get(_processor)
+                if processor is None:
+                    # Create a modified copy of the config using dataclasses.replace
+                    config_kwargs = {}
+                    if price is not None:
+                        config_kwargs['price'] = price
+                    if description is not None:
+                        config_kwargs['description'] = description
+                    
+                    config = replace(_processor.config, **config_kwargs)
+                    processor = X402PaymentProcessor(config)
+                    derived_processors[_processor] = processor
             else:
                 processor = _processor
             
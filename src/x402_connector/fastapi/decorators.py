@@ -1,6 +1,8 @@
 """Decorators for protecting FastAPI routes with x402 payments."""
 
 import logging
+import weakref
+from dataclasses import replace
 from functools import wraps
 from typing import Optional, Callable
 
@@ -61,6 +63,10 @@ def require_payment(price: Optional[str] = None, description: Optional[str] = No
         ...     return {'data': 'content'}
     """
     def decorator(route_func: Callable) -> Callable:
+        # Processors with this route's price/description, derived once per
+        # base processor rather than rebuilt (with a new facilitator) per request
+        derived_processors = weakref.WeakKeyDictionary()
+        
         @wraps(route_func)
         async def wrapper(request: Request, *args, **kwargs):
             # Try to get processor from request state (set by middleware)
@@ -81,19 +87,18 @@ def require_payment(price: Optional[str] = None, description: Optional[str] = No
             
             # Override price/description if specified
             if price is not None or description is not None:
-                # Create a modified copy of the config using dataclasses.replace
-                from dataclasses import replace
-                
-                kwargs_dict = {}
-                if price is not None:
-                    kwargs_dict['price'] = price
-                if description is not None:
-                    kwargs_dict['description'] = description
-                
-                config = replace(processor.config, **kwargs_dict)
-                
-                # Create temporary processor with modified config
-                temp_processor = X402PaymentProcessor(config)
+                temp_processor = derived_processors.get(processor)
+                if temp_processor is None:
+                    # Create a modified copy of the config using dataclasses.replace
+                    kwargs_dict = {}
+                    if price is not None:
+                        kwargs_dict['price'] = price
+                    if description is not None:
+                        kwargs_dict['description'] = description
+                    
+                    config = replace(processor.config, **kwargs_dict)
+                    temp_processor = X402PaymentProcessor(config)
+                    derived_processors[processor] = temp_processor
             else:
                 temp_processor = processor
             
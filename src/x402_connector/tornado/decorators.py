@@ -1,6 +1,8 @@
 """Decorators for protecting Tornado handlers with x402 payments."""
 
 import logging
+import weakref
+from dataclasses import replace
 from functools import wraps
 from typing import Optional
 
@@ -50,6 +52,10 @@ def require_payment(price: Optional[str] = None, description: Optional[str] = No
         >>> ioloop.IOLoop.current().start()
     """
     def decorator(method):
+        # Processors with this route's price/description, derived once per
+        # base processor rather than rebuilt (with a new facilitator) per request
+        derived_processors = weakref.WeakKeyDictionary()
+        
         @wraps(method)
         async def wrapper(self: RequestHandler, *args, **kwargs):
             # Get processor from app settings
@@ -70,19 +76,18 @@ def require_payment(price: Optional[str] = None, description: Optional[str] = No
             
             # Override price/description if specified
             if price is not None or description is not None:
-                # Create a modified copy of the config using dataclasses.replace
-                from dataclasses import replace
-                
-                config_kwargs = {}
-                if price is not None:
-                    config_kwargs['price'] = price
-                if description is not None:
-                    config_kwargs['description'] = description
-                
-                config = replace(processor.config, **config_kwargs)
-                
-                # Create temporary processor with modified config
-                temp_processor = X402PaymentProcessor(config)
+                temp_processor = derived_processors.get(processor)
+                if temp_processor is None:
+                    # Create a modified copy of the config using dataclasses.replace
+                    config_kwargs = {}
+                    if price is not None:
+                        config_kwargs['price'] = price
+                    if description is not None:
+                        config_kwargs['description'] = description
+                    
+                    config = replace(processor.config, **config_kwargs)
+                    temp_processor = X402PaymentProcessor(config)
+                    derived_processors[processor] = temp_processor
             else:
                 temp_processor = processor
             
@@ -1,6 +1,7 @@
 """Tornado middleware for x402 payment processing."""
 
 import logging
+import re
 from typing import Optional, Dict, Any, Callable
 
 from tornado.web import Application, RequestHandler
@@ -11,6 +12,9 @@ from .adapter import TornadoAdapter
 
 logger = logging.getLogger(__name__)
 
+# Common browser user agent keywords
+_BROWSER_UA_RE = re.compile('Mozilla|Chrome|Safari|Firefox|Edge|Opera')
+
 
 def is_browser_request(headers: dict) -> bool:
     """Check if request is from a browser based on headers.
@@ -29,10 +33,7 @@ def is_browser_request(headers: dict) -> bool:
         return True
     
     # Check for common browser user agents
-    browser_keywords = [
-        'Mozilla', 'Chrome', 'Safari', 'Firefox', 'Edge', 'Opera'
-    ]
-    return any(keyword in user_agent for keyword in browser_keywords)
+    return _BROWSER_UA_RE.search(user_agent) is not None
 
 
 class X402Middleware:
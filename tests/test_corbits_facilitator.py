@@ -50,7 +50,7 @@ class TestCorbitsFacilitator:
         assert 'Authorization' not in headers
         assert headers['Content-Type'] == 'application/json'
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_verify_success(self, mock_post):
         """Test successful payment verification."""
         # Mock successful response
@@ -82,7 +82,7 @@ class TestCorbitsFacilitator:
         assert result['payer'] == TEST_ADDRESS_FROM
         mock_post.assert_called_once()
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_verify_with_alternative_response_format(self, mock_post):
         """Test verification with alternative response format."""
         # Mock response with 'valid' instead of 'isValid'
@@ -105,7 +105,7 @@ class TestCorbitsFacilitator:
         assert result['isValid'] is True
         assert result['payer'] == TEST_ADDRESS_FROM
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_verify_auth_error(self, mock_post):
         """Test verification with authentication error."""
         # Mock 401 response
@@ -123,7 +123,7 @@ class TestCorbitsFacilitator:
         assert result['isValid'] is False
         assert result['invalidReason'] == 'facilitator_auth_error'
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_verify_timeout(self, mock_post):
         """Test verification timeout."""
         mock_post.side_effect = requests.exceptions.Timeout()
@@ -138,7 +138,7 @@ class TestCorbitsFacilitator:
         assert result['isValid'] is False
         assert result['invalidReason'] == 'facilitator_timeout'
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_settle_success(self, mock_post):
         """Test successful payment settlement."""
         # Mock successful response
@@ -162,7 +162,7 @@ class TestCorbitsFacilitator:
         assert 'receipt' in result
         mock_post.assert_called_once()
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_settle_with_alternative_field_names(self, mock_post):
         """Test settlement with alternative transaction field names."""
         # Mock response with 'transactionHash' instead of 'transaction'
@@ -183,7 +183,7 @@ class TestCorbitsFacilitator:
         assert result['success'] is True
         assert result['transaction'] == '0xdef456abc789'
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_settle_auth_error(self, mock_post):
         """Test settlement with authentication error."""
         # Mock 401 response
@@ -201,7 +201,7 @@ class TestCorbitsFacilitator:
         assert result['success'] is False
         assert 'Authentication failed' in result['error']
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_settle_error_with_json_response(self, mock_post):
         """Test settlement error with JSON error message."""
         # Mock error response with JSON
@@ -224,7 +224,7 @@ class TestCorbitsFacilitator:
         assert result['success'] is False
         assert 'Invalid payment data' in result['error']
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_settle_timeout(self, mock_post):
         """Test settlement timeout."""
         mock_post.side_effect = requests.exceptions.Timeout()
@@ -239,7 +239,7 @@ class TestCorbitsFacilitator:
         assert result['success'] is False
         assert 'timeout' in result['error']
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_durable_nonce_info_success(self, mock_get):
         """Test getting durable nonce info successfully."""
         # Mock successful response
@@ -259,7 +259,7 @@ class TestCorbitsFacilitator:
         assert result is not None
         assert result['account'] == 'NonceAccountAddress1234567890'
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_durable_nonce_info_not_available(self, mock_get):
         """Test when durable nonce info is not available."""
         # Mock not found response
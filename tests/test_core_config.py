@@ -2,7 +2,7 @@
 
 import os
 import pytest
-from x402_connector.core.config import X402Config
+from x402_connector.core.config import X402Config, clear_env_cache
 
 # Test placeholder address (not a real wallet)
 TEST_ADDRESS = 'TestSolanaAddress1234567890123456789012'
@@ -109,6 +109,29 @@ class TestX402Config:
             del os.environ['X402_PRICE']
             del os.environ['X402_NETWORK']
     
+    def test_from_env_returns_independent_configs(self):
+        """Test from_env returns a fresh config per call and tracks env changes."""
+        os.environ['X402_PAY_TO_ADDRESS'] = TEST_ADDRESS
+        
+        try:
+            config = X402Config.from_env()
+            config.price = '$9.99'
+            config.protected_paths.append('/mutated')
+            config.local['verify_balance'] = True
+            
+            other = X402Config.from_env()
+            assert other is not config
+            assert other.price == '$0.01'
+            assert other.protected_paths == ['*']
+            assert other.local is not config.local
+            
+            os.environ['X402_PRICE'] = '$0.03'
+            assert X402Config.from_env().price == '$0.03'
+            clear_env_cache()
+        finally:
+            del os.environ['X402_PAY_TO_ADDRESS']
+            os.environ.pop('X402_PRICE', None)
+    
     def test_from_env_missing_required_raises_error(self):
         """Test that missing required env vars raise ValueError."""
         # Make sure PAY_TO_ADDRESS is not set
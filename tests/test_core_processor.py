@@ -335,6 +335,25 @@ class TestX402PaymentProcessor:
         assert processor._is_protected_path('/any/path') is True
         assert processor._is_protected_path('/another/path') is True
     
+    def test_is_protected_path_multiple_patterns(self, config):
+        """Test matching against several patterns at once."""
+        config.protected_paths = ['/api/premium/*', '/api/report', '/paid.v1/*']
+        processor = X402PaymentProcessor(config, facilitator=Mock())
+        
+        assert processor._is_protected_path('/api/premium/data') is True
+        assert processor._is_protected_path('/api/report') is True
+        assert processor._is_protected_path('/api/report/2024') is False
+        assert processor._is_protected_path('/paid.v1/item') is True
+        assert processor._is_protected_path('/paidXv1/item') is False
+    
+    def test_is_protected_path_none(self, config):
+        """Test empty protected paths match nothing."""
+        config.protected_paths = []
+        processor = X402PaymentProcessor(config, facilitator=Mock())
+        
+        assert processor._is_protected_path('/api/premium/data') is False
+        assert processor._is_protected_path('') is False
+    
     def test_build_payment_requirements(self, processor):
         """Test building payment requirements."""
         context = RequestContext(
@@ -82,6 +82,20 @@ class TestFacilitatorsFactory:
         
         assert isinstance(facilitator, HybridFacilitator)
     
+    def test_get_facilitator_hybrid_mode_with_empty_local(self):
+        """Test hybrid mode works when no local config is given."""
+        config = X402Config(
+            pay_to_address='TestAddress1234567890123456789012',
+            network='solana-mainnet',
+            facilitator_mode='hybrid',
+            local={},
+            payai={'facilitator_url': 'https://facilitator.payai.network'},
+        )
+        
+        facilitator = get_facilitator(config)
+        
+        assert isinstance(facilitator, HybridFacilitator)
+    
     def test_get_facilitator_hybrid_mode_with_corbits(self):
         """Test factory creates Hybrid facilitator with Corbits settlement."""
         config = X402Config(
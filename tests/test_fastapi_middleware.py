@@ -1,6 +1,7 @@
 """Tests for FastAPI middleware."""
 
 import pytest
+from unittest.mock import patch
 from fastapi import FastAPI, Request
 from fastapi.testclient import TestClient
 
@@ -186,6 +187,25 @@ def test_custom_description_in_decorator(configured_app):
     assert response.status_code == 402
 
 
+def test_decorator_reuses_custom_price_processor(configured_app):
+    """Test that a custom-price processor is built once, not per request."""
+    from x402_connector.fastapi import decorators
+    
+    @configured_app.get('/expensive')
+    @require_payment(price='$1.00')
+    async def expensive_endpoint(request: Request):
+        return {'data': 'expensive'}
+    
+    client = TestClient(configured_app)
+    with patch.object(
+        decorators, 'X402PaymentProcessor', wraps=decorators.X402PaymentProcessor
+    ) as processor_cls:
+        assert client.get('/expensive').status_code == 402
+        assert client.get('/expensive').status_code == 402
+    
+    assert processor_cls.call_count == 1
+
+
 def test_async_route_support():
     """Test that async routes work properly."""
     app = FastAPI()
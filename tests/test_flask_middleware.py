@@ -208,6 +208,30 @@ def test_custom_price_in_decorator():
     assert data['accepts'][0]['maxAmountRequired'] == '1000000'
 
 
+def test_decorator_reuses_custom_price_processor(configured_app):
+    """Test that a custom-price processor is built once, not per request."""
+    from unittest.mock import patch
+    from x402_connector.flask import decorators, require_payment
+    
+    # Don't let middleware interfere with decorator
+    configured_app.config['X402_CONFIG']['protected_paths'] = []
+    x402 = X402(configured_app)
+    
+    @configured_app.route('/expensive')
+    @require_payment(price='$1.00')
+    def expensive_endpoint():
+        return {'data': 'expensive'}
+    
+    client = configured_app.test_client()
+    with patch.object(
+        decorators, 'X402PaymentProcessor', wraps=decorators.X402PaymentProcessor
+    ) as processor_cls:
+        assert client.get('/expensive').status_code == 402
+        assert client.get('/expensive').status_code == 402
+    
+    assert processor_cls.call_count == 1
+
+
 def test_custom_description_in_decorator(configured_app):
     """Test decorator with custom description."""
     from x402_connector.flask import require_payment
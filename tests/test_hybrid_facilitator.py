@@ -62,6 +62,21 @@ class TestHybridFacilitator:
         assert facilitator.verify_mode == 'local'
         assert facilitator.settle_mode == 'payai'
     
+    def test_initialization_with_local_none(self):
+        """Test an empty local config passed as None verifies every network."""
+        config = {
+            'local': None,
+            'payai': {'facilitator_url': 'https://facilitator.payai.network'},
+        }
+        
+        facilitator = HybridFacilitator(config=config)
+        facilitator.verifier.verify = Mock(return_value={'isValid': True})
+        
+        facilitator.verify({'network': 'solana-devnet'}, {'payTo': TEST_ADDRESS_TO})
+        
+        assert isinstance(facilitator.verifier, SolanaFacilitator)
+        facilitator.verifier.verify.assert_called_once()
+    
     def test_initialization_invalid_verify_mode(self):
         """Test initialization with invalid verify mode."""
         config = {
@@ -107,6 +122,26 @@ class TestHybridFacilitator:
         assert result['payer'] == TEST_ADDRESS_FROM
         facilitator.verifier.verify.assert_called_once_with(payment, requirements)
     
+    def test_verify_unsupported_network_uses_remote(self):
+        """Test networks outside supported_networks skip local verification."""
+        config = {
+            'local': {'supported_networks': ['solana-mainnet']},
+            'payai': {},
+        }
+        
+        facilitator = HybridFacilitator(config=config)
+        facilitator.verifier.verify = Mock()
+        facilitator.settler.verify = Mock(return_value={'isValid': True})
+        
+        payment = {'x402Version': 1, 'network': 'solana-devnet'}
+        requirements = {'payTo': TEST_ADDRESS_TO}
+        
+        result = facilitator.verify(payment, requirements)
+        
+        assert result['isValid'] is True
+        facilitator.settler.verify.assert_called_once_with(payment, requirements)
+        facilitator.verifier.verify.assert_not_called()
+    
     def test_verify_failure_logged(self):
         """Test verification failure is logged."""
         config = {
@@ -50,7 +50,7 @@ class TestPayAIFacilitator:
         assert 'Authorization' not in headers
         assert headers['Content-Type'] == 'application/json'
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_verify_success(self, mock_post):
         """Test successful payment verification."""
         # Mock successful response
@@ -84,7 +84,7 @@ class TestPayAIFacilitator:
         assert result['payer'] == TEST_ADDRESS_FROM
         mock_post.assert_called_once()
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_verify_failure(self, mock_post):
         """Test failed payment verification."""
         # Mock failed response
@@ -106,7 +106,7 @@ class TestPayAIFacilitator:
         assert result['isValid'] is False
         assert 'invalid_signature' in result['invalidReason']
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_verify_http_error(self, mock_post):
         """Test verification with HTTP error."""
         # Mock error response
@@ -125,7 +125,7 @@ class TestPayAIFacilitator:
         assert result['isValid'] is False
         assert 'facilitator_error' in result['invalidReason']
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_verify_timeout(self, mock_post):
         """Test verification timeout."""
         mock_post.side_effect = requests.exceptions.Timeout()
@@ -140,7 +140,7 @@ class TestPayAIFacilitator:
         assert result['isValid'] is False
         assert result['invalidReason'] == 'facilitator_timeout'
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_settle_success(self, mock_post):
         """Test successful payment settlement."""
         # Mock successful response
@@ -166,7 +166,7 @@ class TestPayAIFacilitator:
         assert result['transaction'] == '0xabc123def456'
         mock_post.assert_called_once()
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_settle_no_transaction_hash(self, mock_post):
         """Test settlement without transaction hash in response."""
         # Mock response without transaction hash
@@ -185,7 +185,7 @@ class TestPayAIFacilitator:
         assert result['success'] is False
         assert 'No transaction hash' in result['error']
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_settle_http_error(self, mock_post):
         """Test settlement with HTTP error."""
         # Mock error response
@@ -204,7 +204,7 @@ class TestPayAIFacilitator:
         assert result['success'] is False
         assert 'Facilitator error' in result['error']
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_settle_timeout(self, mock_post):
         """Test settlement timeout."""
         mock_post.side_effect = requests.exceptions.Timeout()
@@ -219,7 +219,7 @@ class TestPayAIFacilitator:
         assert result['success'] is False
         assert 'timeout' in result['error']
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_durable_nonce_info_success(self, mock_get):
         """Test getting durable nonce info successfully."""
         # Mock successful response
@@ -240,7 +240,7 @@ class TestPayAIFacilitator:
         assert result['account'] == 'NonceAccountAddress1234567890'
         assert result['nonce'] == 'nonce_value_base64'
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_durable_nonce_info_not_available(self, mock_get):
         """Test when durable nonce info is not available."""
         # Mock not found response
@@ -254,7 +254,7 @@ class TestPayAIFacilitator:
         
         assert result is None
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_durable_nonce_info_error(self, mock_get):
         """Test error handling in durable nonce info."""
         mock_get.side_effect = Exception('Connection error')
@@ -265,3 +265,18 @@ class TestPayAIFacilitator:
         
         assert result is None
 
+    @patch.dict('os.environ', {'PAYAI_API_KEY': 'test_api_key'})
+    @patch('requests.Session.post')
+    def test_requests_share_session(self, mock_post):
+        """Test verify and settle reuse one session with auth headers."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {'isValid': True, 'transaction': 'tx'}
+        mock_post.return_value = mock_response
+        
+        with PayAIFacilitator() as facilitator:
+            facilitator.verify({'x402Version': 1}, {'payTo': TEST_ADDRESS_TO})
+            facilitator.settle({'x402Version': 1}, {'payTo': TEST_ADDRESS_TO})
+            
+            assert mock_post.call_count == 2
+            assert facilitator._session.headers['Authorization'] == 'Bearer test_api_key'
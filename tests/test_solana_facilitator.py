@@ -223,3 +223,75 @@ class TestSolanaFacilitator:
         assert result['success'] is True
         assert 'demo_mode_tx_' in result['transaction']
         assert 'DEMO MODE' in result['note']
+    
+    def test_nonce_cache_remembers_beyond_recent_window(self):
+        """Test nonces stay rejected after leaving the exact recent set."""
+        from x402_connector.core.facilitators.local import _NonceBloom
+        
+        nonces = _NonceBloom(capacity=1000, recent=8)
+        keys = [f'nonce-{i}'.encode() for i in range(900)]
+        for key in keys:
+            assert key not in nonces
+            nonces.add(key, valid_before=2000, now=1000)
+        
+        # Nothing has expired yet, so no filter may be cleared
+        assert all(key in nonces for key in keys)
+        assert b'never-seen' not in nonces
+        
+        # Once the stale nonces have expired, the filters rotate
+        for i in range(1100):
+            nonces.add(f'later-{i}'.encode(), valid_before=9000, now=3000)
+        assert all(f'later-{i}'.encode() in nonces for i in range(600, 1100))
+    
+    def test_nonce_cache_keeps_non_expiring_nonces(self):
+        """Test nonces without validBefore are never forgotten."""
+        from x402_connector.core.facilitators.local import _NonceBloom
+        
+        nonces = _NonceBloom(capacity=10, recent=2)
+        nonces.add(b'forever', valid_before=0, now=1000)
+        for i in range(100):
+            nonces.add(f'nonce-{i}'.encode(), valid_before=1001, now=1000 + i)
+        
+        assert b'forever' in nonces
+    
+    def test_verify_failures_are_independent_dicts(self):
+        """Test fixed-reason failures return a fresh, JSON-serializable dict."""
+        import json
+        
+        facilitator = SolanaFacilitator()
+        payment = {'x402Version': 2}
+        requirements = {'scheme': 'exact', 'network': 'solana-devnet'}
+        
+        result = facilitator.verify(payment, requirements)
+        result['requestId'] = 'abc'
+        
+        again = facilitator.verify(payment, requirements)
+        assert type(again) is dict
+        assert again == {'isValid': False, 'invalidReason': 'invalid_x402_version'}
+        assert json.loads(json.dumps(again)) == again
+    
+    def test_durable_nonce_info_is_cached(self):
+        """Test durable nonce info is reused within its TTL."""
+        facilitator = SolanaFacilitator({'nonce_info_ttl': 60})
+        facilitator._durable_nonce_account = TEST_ADDRESS_FROM
+        info = {'account': TEST_ADDRESS_FROM, 'nonce': 'abc'}
+        facilitator._fetch_durable_nonce_info = Mock(return_value=info)
+        
+        assert facilitator.get_durable_nonce_info() is info
+        assert facilitator.get_durable_nonce_info() is info
+        facilitator._fetch_durable_nonce_info.assert_called_once()
+    
+    def test_durable_nonce_info_not_cached_by_default(self):
+        """Test an instance sees a nonce advanced by another instance at once."""
+        settler = SolanaFacilitator()
+        other = SolanaFacilitator()
+        other._durable_nonce_account = TEST_ADDRESS_FROM
+        other._fetch_durable_nonce_info = Mock(side_effect=[
+            {'account': TEST_ADDRESS_FROM, 'nonce': 'before'},
+            {'account': TEST_ADDRESS_FROM, 'nonce': 'after'},
+        ])
+        
+        assert other.get_durable_nonce_info()['nonce'] == 'before'
+        # settler broadcasts, advancing the nonce; other is never told
+        settler._nonce_info_cache = (0.0, None)
+        assert other.get_durable_nonce_info()['nonce'] == 'after'